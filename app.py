@@ -6,27 +6,117 @@ Description: Comprehensive tournament management system for ICF competitions
 Features: Match scheduling, judge assignment, rule management, result tracking
 """
 
+from time import perf_counter
+_startup_started = perf_counter()
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 import os
 import random
 from dotenv import load_dotenv
-from itertools import combinations
 from typing import Optional
 import re
 import datetime
 import asyncio
-import glob
 from discord.ui import Button, View
-import pytz
-from PIL import Image, ImageDraw, ImageFont
 # Removed pilmoji import due to dependency issues
 import io
 import json
+import copy
 from pathlib import Path
-import requests
+import hashlib
+import functools
+import threading
+import sqlite3
+import struct
+import bisect
+import heapq
+import itertools
+import unicodedata
+import importlib
+import collections
+import mmap
+import concurrent.futures
+import multiprocessing
 import tempfile
+import aiohttp
+
+# ===========================================================================================
+# STARTUP PROFILER AND LAZY IMPORTS
+# ===========================================================================================
+
+# Set to 1 to print how long each startup phase and deferred import took
+STARTUP_PROFILE = os.environ.get("STARTUP_PROFILE", "0") == "1"
+
+# Set to 0 to skip warming Pillow, fonts and poster workers after ready (they then load on first use)
+STARTUP_WARMUP = os.environ.get("STARTUP_WARMUP", "1") == "1"
+
+class StartupProfiler:
+    """Records the duration of each startup phase (and of deferred imports) for STARTUP_PROFILE"""
+    
+    def __init__(self, started: float):
+        self.started = started
+        self._last = started
+        self.phases = []
+        self.imports = []
+        self.reported = False
+    
+    def mark(self, phase: str):
+        """Close the current phase (timed from the previous mark)"""
+        now = perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+    
+    def record_import(self, module_name: str, elapsed_ms: float):
+        self.imports.append((module_name, elapsed_ms))
+    
+    def report(self):
+        """Print the profile once, if STARTUP_PROFILE is set"""
+        if self.reported:
+            return
+        self.reported = True
+        if not STARTUP_PROFILE:
+            return
+        print("⏱️ Startup profile:")
+        for phase, elapsed_ms in self.phases:
+            print(f"   {phase:<28} {elapsed_ms:9.1f} ms")
+        print(f"   {'total':<28} {(self._last - self.started) * 1000:9.1f} ms")
+        for module_name, elapsed_ms in self.imports:
+            print(f"   {'import ' + module_name:<28} {elapsed_ms:9.1f} ms (deferred)")
+
+startup_profiler = StartupProfiler(_startup_started)
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+    
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            start = perf_counter()
+            self._module = importlib.import_module(self._module_name)
+            startup_profiler.record_import(self._module_name, (perf_counter() - start) * 1000)
+        return self._module
+    
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+def lazy_import(module_name: str) -> LazyModule:
+    return LazyModule(module_name)
+
+# Only posters, fonts and timezone math need these, so they are imported on first use
+pytz = lazy_import("pytz")
+requests = lazy_import("requests")
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+ImageFilter = lazy_import("PIL.ImageFilter")
+ImageFont = lazy_import("PIL.ImageFont")
+ImageOps = lazy_import("PIL.ImageOps")
+
+startup_profiler.mark("imports")
 
 # Load environment variables
 load_dotenv()
@@ -62,58 +152,1104 @@ intents.guild_messages = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
-# Store scheduled events for reminders
-scheduled_events = {}
+# ===========================================================================================
+# STORAGE SYSTEM
+# ===========================================================================================
 
-# Load scheduled events from file on startup
-def load_scheduled_events():
-    global scheduled_events
-    try:
-        if os.path.exists('scheduled_events.json'):
-            with open('scheduled_events.json', 'r') as f:
+# Storage backend for events, judge assignments and results: "sqlite" (default) or "json"
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "sqlite").lower()
+STORAGE_DB_PATH = os.environ.get("STORAGE_DB_PATH", "tournament.db")
+
+# JSON backend files: a snapshot plus an append-only journal of changes since it was written
+SCHEDULED_EVENTS_FILE = 'scheduled_events.json'
+SCHEDULED_EVENTS_JOURNAL = 'scheduled_events.journal'
+JUDGE_ASSIGNMENTS_FILE = 'judge_assignments.json'
+MATCH_RESULTS_FILE = 'match_results.jsonl'
+TIMER_JOBS_FILE = 'timer_jobs.json'
+SCREENSHOT_HASHES_FILE = 'screenshot_hashes.jsonl'
+
+# Journal records written before the journal is compacted into a new snapshot
+EVENTS_JOURNAL_COMPACT_THRESHOLD = int(os.environ.get("EVENTS_JOURNAL_COMPACT_THRESHOLD", "200"))
+
+# Seconds to gather state changes before writing them
+PERSIST_DEBOUNCE_SECONDS = float(os.environ.get("PERSIST_DEBOUNCE_SECONDS", "2"))
+
+# Event fields holding discord.Member objects (persisted as <field>_id)
+MEMBER_FIELDS = ('judge', 'team1_captain', 'team2_captain')
+
+def serialize_event_fields(fields: dict) -> dict:
+    """Convert event fields to JSON-safe values (datetimes to ISO strings, members to ids)"""
+    serialized = {}
+    for key, value in fields.items():
+        if isinstance(value, datetime.datetime):
+            serialized[key] = value.isoformat()
+        elif key in MEMBER_FIELDS:
+            # Remove non-serializable objects like discord.Member, keep the id
+            serialized[key] = None
+        else:
+            serialized[key] = value
+    # A live member wins over an id loaded from storage
+    for field in MEMBER_FIELDS:
+        if fields.get(field) is not None:
+            serialized[f"{field}_id"] = getattr(fields[field], 'id', None)
+    return serialized
+
+def deserialize_event(data: dict) -> dict:
+    """Convert a stored event back to its in-memory form"""
+    if isinstance(data.get('datetime'), str):
+        data['datetime'] = datetime.datetime.fromisoformat(data['datetime'])
+    return data
+
+def event_member_id(event_data: dict, field: str) -> Optional[int]:
+    """Id of a member field, from the live discord.Member or the persisted <field>_id"""
+    member = event_data.get(field)
+    if member is not None:
+        return getattr(member, 'id', None)
+    return event_data.get(f"{field}_id")
+
+def atomic_write_json(path: str, data, **dump_kwargs):
+    """Write JSON to a temp file, fsync it and rename it over path"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **dump_kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _apply_journal_record(data: dict, record: dict):
+    """Apply one journal record to a dict of serialized events"""
+    op = record.get('op')
+    event_id = record.get('id')
+    if op == 'put':
+        data[event_id] = record.get('data', {})
+    elif op == 'patch' and event_id in data:
+        data[event_id].update(record.get('fields', {}))
+    elif op == 'del':
+        data.pop(event_id, None)
+
+class JsonEventStore:
+    """
+    JSON file storage backend.
+    
+    Events are kept as a snapshot (scheduled_events.json) plus an append-only journal;
+    judge assignments are a small JSON file, and results and screenshot hashes append-only JSON lines files.
+    The store keeps its own copy of the serialized events to write snapshots from.
+    """
+    
+    name = "json"
+    
+    def __init__(self):
+        self._events = {}
+        self._journal_records = 0
+    
+    def load_events(self) -> dict:
+        data = {}
+        if os.path.exists(SCHEDULED_EVENTS_FILE):
+            with open(SCHEDULED_EVENTS_FILE, 'r') as f:
                 data = json.load(f)
-                # Convert datetime strings back to datetime objects
-                for event_id, event_data in data.items():
-                    if 'datetime' in event_data:
-                        event_data['datetime'] = datetime.datetime.fromisoformat(event_data['datetime'])
-                scheduled_events = data
-                print(f"Loaded {len(scheduled_events)} scheduled events from file")
+        
+        # Replay changes journaled since the snapshot
+        replayed = 0
+        if os.path.exists(SCHEDULED_EVENTS_JOURNAL):
+            with open(SCHEDULED_EVENTS_JOURNAL, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        _apply_journal_record(data, json.loads(line))
+                        replayed += 1
+                    except json.JSONDecodeError:
+                        # A crash mid-append can leave a partial last line
+                        print("Skipping truncated scheduled events journal record")
+        self._journal_records = replayed
+        self._events = json.loads(json.dumps(data))
+        return data
+    
+    def compact(self):
+        """Write the snapshot atomically, then start a fresh journal"""
+        atomic_write_json(SCHEDULED_EVENTS_FILE, self._events, indent=2)
+        with open(SCHEDULED_EVENTS_JOURNAL, 'w', encoding='utf-8'):
+            pass
+        self._journal_records = 0
+    
+    def write_events(self, changes: dict):
+        """
+        Journal a batch of changes ({event_id: serialized event, or None if deleted}).
+        
+        New events are written whole (put); edits to a known event, such as a judge being
+        assigned or exchanged or schedule message ids being set, only journal the fields that
+        changed (patch).
+        """
+        records = []
+        for event_id, data in changes.items():
+            if data is None:
+                if self._events.pop(event_id, None) is not None:
+                    records.append({'op': 'del', 'id': event_id})
+                continue
+            previous = self._events.get(event_id)
+            self._events[event_id] = data
+            if previous is None or previous.keys() - data.keys():
+                records.append({'op': 'put', 'id': event_id, 'data': data})
+                continue
+            fields = {key: value for key, value in data.items() if key not in previous or previous[key] != value}
+            if fields:
+                records.append({'op': 'patch', 'id': event_id, 'fields': fields})
+        if not records:
+            return
+        with open(SCHEDULED_EVENTS_JOURNAL, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(record, separators=(',', ':')) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records += len(records)
+        if self._journal_records >= EVENTS_JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+    
+    def load_judge_assignments(self) -> dict:
+        if not os.path.exists(JUDGE_ASSIGNMENTS_FILE):
+            return {}
+        with open(JUDGE_ASSIGNMENTS_FILE, 'r', encoding='utf-8') as f:
+            return {int(judge_id): event_ids for judge_id, event_ids in json.load(f).items()}
+    
+    def save_judge_assignments(self, assignments: dict):
+        atomic_write_json(JUDGE_ASSIGNMENTS_FILE, {str(judge_id): event_ids for judge_id, event_ids in assignments.items()})
+    
+    def record_results(self, results: list):
+        with open(MATCH_RESULTS_FILE, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(result, separators=(',', ':')) + "\n" for result in results))
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def load_timer_jobs(self) -> list:
+        if not os.path.exists(TIMER_JOBS_FILE):
+            return []
+        with open(TIMER_JOBS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def save_timer_jobs(self, jobs: list):
+        atomic_write_json(TIMER_JOBS_FILE, jobs, separators=(',', ':'))
+    
+    def load_screenshot_hashes(self) -> list:
+        if not os.path.exists(SCREENSHOT_HASHES_FILE):
+            return []
+        records = []
+        with open(SCREENSHOT_HASHES_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave a partial last line
+                    print("Skipping truncated screenshot hash record")
+        return records
+    
+    def record_screenshot_hashes(self, records: list):
+        with open(SCREENSHOT_HASHES_FILE, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(record, separators=(',', ':')) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+
+class SqliteEventStore:
+    """
+    SQLite storage backend (WAL mode).
+    
+    Events are stored as JSON documents with indexed columns for the fields commands look up
+    by (channel, judge, captains, match time); judge assignments, match results and screenshot
+    hashes have their own tables, so all of them survive restarts.
+    """
+    
+    name = "sqlite"
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            event_id TEXT PRIMARY KEY,
+            channel_id INTEGER,
+            judge_id INTEGER,
+            team1_captain_id INTEGER,
+            team2_captain_id INTEGER,
+            match_datetime TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_channel ON events(channel_id);
+        CREATE INDEX IF NOT EXISTS idx_events_judge ON events(judge_id);
+        CREATE INDEX IF NOT EXISTS idx_events_team1 ON events(team1_captain_id);
+        CREATE INDEX IF NOT EXISTS idx_events_team2 ON events(team2_captain_id);
+        CREATE INDEX IF NOT EXISTS idx_events_datetime ON events(match_datetime);
+        
+        CREATE TABLE IF NOT EXISTS judge_assignments (
+            judge_id INTEGER NOT NULL,
+            event_id TEXT NOT NULL,
+            PRIMARY KEY (judge_id, event_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_assignments_event ON judge_assignments(event_id);
+        
+        CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_id INTEGER,
+            tournament TEXT,
+            round TEXT,
+            winner_id INTEGER,
+            winner_score INTEGER,
+            loser_id INTEGER,
+            loser_score INTEGER,
+            judge_id INTEGER,
+            remarks TEXT,
+            created_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_results_channel ON results(channel_id);
+        CREATE INDEX IF NOT EXISTS idx_results_winner ON results(winner_id);
+        CREATE INDEX IF NOT EXISTS idx_results_loser ON results(loser_id);
+        CREATE INDEX IF NOT EXISTS idx_results_judge ON results(judge_id);
+        
+        CREATE TABLE IF NOT EXISTS timer_jobs (
+            kind TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            due REAL NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (kind, event_id)
+        );
+        
+        CREATE TABLE IF NOT EXISTS screenshot_hashes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dhash TEXT,
+            sha256 TEXT NOT NULL,
+            label TEXT,
+            channel_id INTEGER,
+            tournament TEXT,
+            round TEXT,
+            winner_id INTEGER,
+            loser_id INTEGER,
+            message_url TEXT,
+            created_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_screenshot_hashes_sha256 ON screenshot_hashes(sha256);
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+    
+    @staticmethod
+    def _event_row(event_id: str, data: dict) -> tuple:
+        return (
+            event_id,
+            data.get('channel_id'),
+            data.get('judge_id'),
+            data.get('team1_captain_id'),
+            data.get('team2_captain_id'),
+            data.get('datetime'),
+            json.dumps(data, separators=(',', ':'))
+        )
+    
+    def _transaction(self, statements: list):
+        """Run (sql, params) statements in one transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def load_events(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT event_id, data FROM events").fetchall()
+        return {event_id: json.loads(data) for event_id, data in rows}
+    
+    def compact(self):
+        """Fold the WAL back into the database file"""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def write_events(self, changes: dict):
+        """Apply a batch of changes ({event_id: serialized event, or None if deleted}) in one transaction"""
+        self._transaction([
+            ("DELETE FROM events WHERE event_id = ?", (event_id,)) if data is None
+            else ("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", self._event_row(event_id, data))
+            for event_id, data in changes.items()
+        ])
+    
+    def load_judge_assignments(self) -> dict:
+        assignments = {}
+        with self._lock:
+            rows = self._conn.execute("SELECT judge_id, event_id FROM judge_assignments ORDER BY rowid").fetchall()
+        for judge_id, event_id in rows:
+            assignments.setdefault(judge_id, []).append(event_id)
+        return assignments
+    
+    def save_judge_assignments(self, assignments: dict):
+        self._transaction([("DELETE FROM judge_assignments", ())] + [
+            ("INSERT OR IGNORE INTO judge_assignments VALUES (?, ?)", (judge_id, event_id))
+            for judge_id, event_ids in assignments.items()
+            for event_id in event_ids
+        ])
+    
+    def record_results(self, results: list):
+        self._transaction([
+            ("INSERT INTO results (channel_id, tournament, round, winner_id, winner_score, loser_id, loser_score, judge_id, remarks, created_at) "
+             "VALUES (:channel_id, :tournament, :round, :winner_id, :winner_score, :loser_id, :loser_score, :judge_id, :remarks, :created_at)",
+             result)
+            for result in results
+        ])
+    
+    def load_timer_jobs(self) -> list:
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, event_id, due, payload FROM timer_jobs").fetchall()
+        return [{'kind': kind, 'event_id': event_id, 'due': due, 'payload': json.loads(payload)} for kind, event_id, due, payload in rows]
+    
+    def save_timer_jobs(self, jobs: list):
+        self._transaction([("DELETE FROM timer_jobs", ())] + [
+            ("INSERT INTO timer_jobs VALUES (?, ?, ?, ?)", (job['kind'], job['event_id'], job['due'], json.dumps(job['payload'])))
+            for job in jobs
+        ])
+    
+    SCREENSHOT_HASH_COLUMNS = ('dhash', 'sha256', 'label', 'channel_id', 'tournament', 'round', 'winner_id', 'loser_id', 'message_url', 'created_at')
+    
+    def load_screenshot_hashes(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(self.SCREENSHOT_HASH_COLUMNS)} FROM screenshot_hashes ORDER BY id").fetchall()
+        return [dict(zip(self.SCREENSHOT_HASH_COLUMNS, row)) for row in rows]
+    
+    def record_screenshot_hashes(self, records: list):
+        columns = self.SCREENSHOT_HASH_COLUMNS
+        self._transaction([
+            (f"INSERT INTO screenshot_hashes ({', '.join(columns)}) VALUES ({', '.join(':' + column for column in columns)})",
+             {column: record.get(column) for column in columns})
+            for record in records
+        ])
+
+def create_event_store():
+    """Open the configured storage backend, falling back to JSON files if SQLite is unavailable"""
+    if STORAGE_BACKEND == "sqlite":
+        try:
+            store = SqliteEventStore(STORAGE_DB_PATH)
+            # One-time migration from the JSON files
+            if not store.load_events() and os.path.exists(SCHEDULED_EVENTS_FILE):
+                legacy_store = JsonEventStore()
+                store.write_events(legacy_store.load_events())
+                store.save_judge_assignments(legacy_store.load_judge_assignments())
+                store.save_timer_jobs(legacy_store.load_timer_jobs())
+                # Move the imported files aside so an empty database later isn't re-seeded with stale events
+                for path in (SCHEDULED_EVENTS_FILE, SCHEDULED_EVENTS_JOURNAL, JUDGE_ASSIGNMENTS_FILE, TIMER_JOBS_FILE):
+                    if os.path.exists(path):
+                        os.replace(path, path + ".migrated")
+                print(f"Migrated scheduled events from {SCHEDULED_EVENTS_FILE} to {STORAGE_DB_PATH}")
+            print(f"Using SQLite storage: {STORAGE_DB_PATH}")
+            return store
+        except Exception as e:
+            print(f"Error opening SQLite storage, falling back to JSON files: {e}")
+    return JsonEventStore()
+
+event_store = None
+
+def get_event_store():
+    """Return the storage backend, opening it on first use"""
+    global event_store
+    if event_store is None:
+        event_store = create_event_store()
+    return event_store
+
+class PersistenceWriter:
+    """
+    Debounced background writer for bot state.
+    
+    Mutations only mark a named source dirty. Changes arriving within PERSIST_DEBOUNCE_SECONDS
+    are coalesced into one write, which runs on a single writer thread so disk I/O never blocks
+    the event loop and writes never interleave. Each source has a snapshot function, called on
+    the loop to copy the state, and a write function, called on the writer thread with the copy.
+    """
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._sources = {}
+        self._dirty = {}  # insertion-ordered set of source names
+        self._timer = None
+        self._flush_task = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="persist")
+        self.writes = 0
+        self.coalesced = 0
+    
+    def register(self, name: str, snapshot, write):
+        self._sources[name] = (snapshot, write)
+    
+    def mark_dirty(self, name: str):
+        if name in self._dirty:
+            self.coalesced += 1
+        self._dirty[name] = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (startup, scripts): write straight away
+            self.flush_now()
+            return
+        if self._timer is None:
+            self._timer = loop.call_later(self.delay, self._start_flush)
+    
+    def _start_flush(self):
+        # Keep a reference: the loop holds tasks weakly, and a collected flush would drop the write
+        self._timer = None
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+    
+    def _take_snapshots(self) -> list:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        jobs = []
+        for name in self._dirty:
+            snapshot, write = self._sources[name]
+            jobs.append((name, write, snapshot()))
+        self._dirty.clear()
+        return jobs
+    
+    def _write(self, jobs: list):
+        for name, write, data in jobs:
+            try:
+                write(data)
+                self.writes += 1
+            except Exception as e:
+                print(f"Error writing {name}: {e}")
+    
+    async def flush(self):
+        """Write everything pending now"""
+        jobs = self._take_snapshots()
+        if jobs:
+            await asyncio.wrap_future(self._executor.submit(self._write, jobs))
+    
+    async def close(self):
+        """Wait for a debounced flush already in progress, then write everything still pending"""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self.flush()
+    
+    def flush_now(self):
+        """Write everything pending and wait for it (no event loop needed)"""
+        jobs = self._take_snapshots()
+        if jobs:
+            self._executor.submit(self._write, jobs).result()
+    
+    async def run(self, func, *args):
+        """Run a storage call on the writer thread, after any writes already queued"""
+        return await asyncio.wrap_future(self._executor.submit(func, *args))
+    
+    def shutdown(self):
+        """Flush pending changes and stop the writer thread"""
+        self.flush_now()
+        self._executor.shutdown(wait=True)
+        if self.writes:
+            print(f"Persistence writer: {self.writes} write(s), {self.coalesced} change(s) coalesced")
+
+persistence_writer = PersistenceWriter(PERSIST_DEBOUNCE_SECONDS)
+
+# Pending storage changes, written by persistence_writer
+_dirty_event_ids = {}  # insertion-ordered set of event ids
+_pending_results = []
+_pending_screenshot_hashes = []
+
+def _snapshot_events() -> dict:
+    changes = {
+        event_id: serialize_event_fields(scheduled_events[event_id]) if event_id in scheduled_events else None
+        for event_id in _dirty_event_ids
+    }
+    _dirty_event_ids.clear()
+    return changes
+
+def _snapshot_results() -> list:
+    results = list(_pending_results)
+    _pending_results.clear()
+    return results
+
+def _snapshot_screenshot_hashes() -> list:
+    records = list(_pending_screenshot_hashes)
+    _pending_screenshot_hashes.clear()
+    return records
+
+persistence_writer.register("events", _snapshot_events, lambda changes: get_event_store().write_events(changes))
+persistence_writer.register(
+    "judge_assignments",
+    lambda: {judge_id: list(event_ids) for judge_id, event_ids in judge_assignments.items()},
+    lambda assignments: get_event_store().save_judge_assignments(assignments)
+)
+persistence_writer.register("results", _snapshot_results, lambda results: get_event_store().record_results(results))
+persistence_writer.register("screenshot_hashes", _snapshot_screenshot_hashes, lambda records: get_event_store().record_screenshot_hashes(records))
+
+def _read_stored_events():
+    store = get_event_store()
+    return store.name, store.load_events(), store.load_judge_assignments()
+
+# Load scheduled events and judge assignments from storage on startup
+async def load_scheduled_events():
+    global judge_assignments
+    try:
+        store_name, events, assignments = await persistence_writer.run(_read_stored_events)
+        scheduled_events.reset({event_id: deserialize_event(data) for event_id, data in events.items()})
+        judge_assignments = assignments
+        print(f"Loaded {len(scheduled_events)} scheduled events from {store_name} storage")
+        for problem in scheduled_events.check_consistency():
+            print(f"Event registry inconsistency: {problem}")
     except Exception as e:
         print(f"Error loading scheduled events: {e}")
-        scheduled_events = {}
+        scheduled_events.clear()
 
-# Save scheduled events to file
-def save_scheduled_events():
+# Write pending changes and compact storage (JSON snapshot/journal or SQLite WAL)
+async def save_scheduled_events():
     try:
-        # Convert datetime objects to strings for JSON serialization
-        data_to_save = {}
-        for event_id, event_data in scheduled_events.items():
-            event_copy = event_data.copy()
-            if 'datetime' in event_copy:
-                event_copy['datetime'] = event_copy['datetime'].isoformat()
-            # Remove non-serializable objects like discord.Member
-            if 'judge' in event_copy:
-                event_copy['judge'] = None
-            if 'team1_captain' in event_copy:
-                event_copy['team1_captain'] = None
-            if 'team2_captain' in event_copy:
-                event_copy['team2_captain'] = None
-            data_to_save[event_id] = event_copy
-        
-        with open('scheduled_events.json', 'w') as f:
-            json.dump(data_to_save, f, indent=2)
+        await persistence_writer.flush()
+        await persistence_writer.run(get_event_store().compact)
     except Exception as e:
         print(f"Error saving scheduled events: {e}")
 
-# Track per-event reminder tasks (for cancellation/update)
-reminder_tasks = {}
+def persist_event(event_id: str):
+    """Queue an event to be written (created, edited or deleted)"""
+    _dirty_event_ids[event_id] = None
+    persistence_writer.mark_dirty("events")
+
+def persist_result(result: dict):
+    """Queue a posted match result to be written"""
+    _pending_results.append(result)
+    persistence_writer.mark_dirty("results")
+
+def persist_screenshot_hashes(records: list):
+    """Queue fingerprints of posted result screenshots to be written"""
+    _pending_screenshot_hashes.extend(records)
+    persistence_writer.mark_dirty("screenshot_hashes")
+
+# ===========================================================================================
+# EVENT REGISTRY
+# ===========================================================================================
+
+def event_time_key(value) -> datetime.datetime:
+    """Sort key for an event datetime (naive UTC; events without one sort last)"""
+    if not isinstance(value, datetime.datetime):
+        return datetime.datetime.max
+    if value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+class EventRegistry(dict):
+    """
+    Scheduled events keyed by event id, with secondary indexes.
+    
+    Channel, judge and captain maps, the set of events without a judge and a datetime-ordered
+    timeline are kept in step with every insert and delete, so lookups cost O(matches) instead
+    of a scan over all events. Indexed fields (channel_id, datetime, judge, captains) edited in
+    place must go through update_event() so the indexes follow.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._by_channel = collections.defaultdict(set)
+        self._by_judge = collections.defaultdict(set)
+        self._by_captain = collections.defaultdict(set)
+        self._unassigned = set()
+        self._timeline = []  # sorted [(time_key, event_id)]
+        self._index_keys = {}  # {event_id: (channel_id, judge_id, captain_ids, time_key)}
+    
+    @staticmethod
+    def _keys_for(data: dict) -> tuple:
+        captains = tuple(
+            captain_id for captain_id in (event_member_id(data, 'team1_captain'), event_member_id(data, 'team2_captain'))
+            if captain_id
+        )
+        return data.get('channel_id'), event_member_id(data, 'judge'), captains, event_time_key(data.get('datetime'))
+    
+    @staticmethod
+    def _discard(index: dict, key, event_id: str):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(event_id)
+            if not bucket:
+                del index[key]
+    
+    def _index(self, event_id: str, data: dict):
+        channel_id, judge_id, captains, time_key = keys = self._keys_for(data)
+        self._index_keys[event_id] = keys
+        self._by_channel[channel_id].add(event_id)
+        if judge_id:
+            self._by_judge[judge_id].add(event_id)
+        else:
+            self._unassigned.add(event_id)
+        for captain_id in captains:
+            self._by_captain[captain_id].add(event_id)
+        bisect.insort(self._timeline, (time_key, event_id))
+    
+    def _unindex(self, event_id: str):
+        # Remove the keys recorded at insert time, even if the event dict was edited since
+        keys = self._index_keys.pop(event_id, None)
+        if keys is None:
+            return
+        channel_id, judge_id, captains, time_key = keys
+        self._discard(self._by_channel, channel_id, event_id)
+        if judge_id:
+            self._discard(self._by_judge, judge_id, event_id)
+        else:
+            self._unassigned.discard(event_id)
+        for captain_id in captains:
+            self._discard(self._by_captain, captain_id, event_id)
+        position = bisect.bisect_left(self._timeline, (time_key, event_id))
+        if position < len(self._timeline) and self._timeline[position] == (time_key, event_id):
+            del self._timeline[position]
+    
+    def __setitem__(self, event_id: str, data: dict):
+        self._unindex(event_id)
+        super().__setitem__(event_id, data)
+        self._index(event_id, data)
+    
+    def __delitem__(self, event_id: str):
+        super().__delitem__(event_id)
+        self._unindex(event_id)
+    
+    def pop(self, event_id: str, *default):
+        if event_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(event_id)
+        data = super().pop(event_id)
+        self._unindex(event_id)
+        return data
+    
+    def popitem(self):
+        event_id, data = super().popitem()
+        self._unindex(event_id)
+        return event_id, data
+    
+    def setdefault(self, event_id: str, default: dict = None):
+        if event_id not in self:
+            self[event_id] = default
+        return self[event_id]
+    
+    def update(self, *args, **kwargs):
+        for event_id, data in dict(*args, **kwargs).items():
+            self[event_id] = data
+    
+    def clear(self):
+        super().clear()
+        for index in (self._by_channel, self._by_judge, self._by_captain, self._unassigned, self._timeline, self._index_keys):
+            index.clear()
+    
+    def reset(self, events: dict):
+        """Replace all events (used when loading from storage)"""
+        self.clear()
+        self.update(events)
+    
+    def update_event(self, event_id: str, **fields):
+        """Edit fields of an event in place, re-indexing it"""
+        data = self[event_id]
+        self._unindex(event_id)
+        data.update(fields)
+        self._index(event_id, data)
+    
+    def events_for_channel(self, channel_id: int) -> list:
+        return list(self._by_channel.get(channel_id, ()))
+    
+    def events_for_captains(self, channel_id: int, captain_a: int, captain_b: int) -> list:
+        """Events in a channel between these two captains (either order)"""
+        candidates = min(self._by_captain.get(captain_a, set()), self._by_captain.get(captain_b, set()), key=len)
+        return [
+            event_id for event_id in candidates
+            if self._index_keys[event_id][0] == channel_id
+            and set(self._index_keys[event_id][2]) == {captain_a, captain_b}
+        ]
+    
+    def events_for_judge(self, judge_id: int, channel_id: int = None) -> list:
+        """Events assigned to a judge, optionally limited to one channel"""
+        return [
+            event_id for event_id in self._by_judge.get(judge_id, ())
+            if channel_id is None or self._index_keys[event_id][0] == channel_id
+        ]
+    
+    def unassigned_events(self) -> list:
+        """Events without a judge, soonest first"""
+        return sorted(self._unassigned, key=lambda event_id: (self._index_keys[event_id][3], event_id))
+    
+    def events_by_time(self) -> list:
+        """All events, soonest first"""
+        return [event_id for _, event_id in self._timeline]
+    
+    def check_consistency(self) -> list:
+        """Compare the indexes with the events they describe and return every mismatch found"""
+        problems = []
+        expected = EventRegistry()
+        for event_id, data in self.items():
+            expected._index(event_id, data)
+            if self._index_keys.get(event_id) != expected._index_keys[event_id]:
+                problems.append(f"event {event_id} indexed as {self._index_keys.get(event_id)}, current {expected._index_keys[event_id]}")
+        stale = set(self._index_keys) - set(self)
+        if stale:
+            problems.append(f"index entries for removed events: {sorted(stale)}")
+        for name in ('_by_channel', '_by_judge', '_by_captain', '_unassigned', '_timeline'):
+            if getattr(self, name) != getattr(expected, name):
+                problems.append(f"{name} does not match the events")
+        return problems
 
-# Track per-event cleanup tasks (to remove finished events after result)
-cleanup_tasks = {}
+# Store scheduled events for reminders
+scheduled_events = EventRegistry()
 
 # Store judge assignments to prevent overloading
 judge_assignments = {}  # {judge_id: [event_ids]}
 
+# ===========================================================================================
+# OUTBOUND MESSAGE DISPATCHER
+# ===========================================================================================
+
+# Priority classes for channel messages (lower is sent first)
+PRIORITY_REMINDER = 0
+PRIORITY_RESULT = 1
+PRIORITY_NOTIFICATION = 2
+PRIORITY_BULK = 3
+PRIORITY_NAMES = {PRIORITY_REMINDER: "reminder", PRIORITY_RESULT: "result", PRIORITY_NOTIFICATION: "notification", PRIORITY_BULK: "bulk"}
+
+# Discord allows about 5 messages per 5 seconds per channel ("sends/seconds")
+OUTBOUND_CHANNEL_RATE = os.environ.get("OUTBOUND_CHANNEL_RATE", "5/5")
+
+class OutboundDispatcher:
+    """
+    Priority queue per channel for every message the bot posts to a channel.
+    
+    Each channel has one worker that sends the highest-priority message first, so a 10-minute
+    reminder never waits behind a batch of result reposts. The worker tracks the channel's send
+    window itself (OUTBOUND_CHANNEL_RATE) and waits for a free slot before sending, instead of
+    running into 429s and discord.py's FIFO retry. If a 429 still comes back, the channel's
+    window is halved, the channel pauses for the Retry-After time and the message is queued
+    again; every full window sent without a 429 afterwards allows one more send, back up to
+    the configured rate. Interaction responses and followups use their own webhook limits
+    and are sent directly.
+    """
+    
+    def __init__(self, rate: str):
+        sends, seconds = rate.split("/")
+        self.window_sends = int(sends)
+        self.window_seconds = float(seconds)
+        self._queues = {}  # {channel_id: [(priority, sequence, enqueued_at, future, channel, kwargs)]}
+        self._workers = {}  # {channel_id: asyncio.Task}
+        self._recent_sends = collections.defaultdict(collections.deque)  # {channel_id: send times in window}
+        self._channel_limits = {}  # {channel_id: sends per window while backed off after a 429}
+        self._clean_sends = collections.Counter()  # {channel_id: sends since the last limit change}
+        self._paused_until = {}  # {channel_id: perf_counter time the Retry-After pause ends}
+        self._sequence = 0
+        self._stats = {
+            priority: {'sent': 0, 'failed': 0, 'wait_ms_total': 0.0, 'wait_ms_max': 0.0}
+            for priority in PRIORITY_NAMES
+        }
+        self.rate_limited = 0
+    
+    async def send(self, channel, priority: int = PRIORITY_NOTIFICATION, **kwargs) -> discord.Message:
+        """Queue channel.send(**kwargs) and wait for the sent message (raises what send raises)"""
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        heapq.heappush(
+            self._queues.setdefault(channel.id, []),
+            (priority, self._sequence, perf_counter(), future, channel, kwargs)
+        )
+        worker = self._workers.get(channel.id)
+        if worker is None or worker.done():
+            self._workers[channel.id] = asyncio.create_task(self._run_channel(channel.id))
+        return await future
+    
+    async def _wait_for_slot(self, channel_id: int):
+        recent = self._recent_sends[channel_id]
+        while True:
+            now = perf_counter()
+            paused_until = self._paused_until.get(channel_id, 0.0)
+            if now < paused_until:
+                await asyncio.sleep(paused_until - now)
+                continue
+            while recent and now - recent[0] >= self.window_seconds:
+                recent.popleft()
+            if len(recent) < self._channel_limits.get(channel_id, self.window_sends):
+                return
+            await asyncio.sleep(self.window_seconds - (now - recent[0]))
+    
+    def _back_off(self, channel_id: int, error: discord.HTTPException):
+        """Halve the channel's window and pause it for Retry-After (or one window)"""
+        self.rate_limited += 1
+        limit = self._channel_limits.get(channel_id, self.window_sends)
+        self._channel_limits[channel_id] = max(1, limit // 2)
+        self._clean_sends[channel_id] = 0
+        try:
+            retry_after = float(error.response.headers.get('Retry-After'))
+        except (AttributeError, TypeError, ValueError):
+            retry_after = self.window_seconds
+        self._paused_until[channel_id] = perf_counter() + retry_after
+        print(f"Rate limited in channel {channel_id}: {self._channel_limits[channel_id]}/{self.window_seconds:g}s for now, pausing {retry_after:.1f}s")
+    
+    def _recover(self, channel_id: int):
+        """Allow one more send per window after a full window without a 429"""
+        limit = self._channel_limits.get(channel_id)
+        if limit is None:
+            return
+        self._clean_sends[channel_id] += 1
+        if self._clean_sends[channel_id] >= limit:
+            self._clean_sends[channel_id] = 0
+            if limit + 1 >= self.window_sends:
+                del self._channel_limits[channel_id]
+            else:
+                self._channel_limits[channel_id] = limit + 1
+    
+    async def _run_channel(self, channel_id: int):
+        queue = self._queues[channel_id]
+        while queue:
+            await self._wait_for_slot(channel_id)
+            # Pick the most urgent message only once a slot is free
+            item = heapq.heappop(queue)
+            priority, sequence, enqueued_at, future, channel, kwargs = item
+            if future.done():
+                continue  # caller gave up
+            wait_ms = (perf_counter() - enqueued_at) * 1000
+            self._recent_sends[channel_id].append(perf_counter())
+            try:
+                message = await channel.send(**kwargs)
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    # Keep the message's place in the queue and try again after the pause
+                    self._back_off(channel_id, e)
+                    heapq.heappush(queue, item)
+                    continue
+                self._finish(priority, wait_ms, future, error=e)
+            except Exception as e:
+                self._finish(priority, wait_ms, future, error=e)
+            else:
+                self._recover(channel_id)
+                self._finish(priority, wait_ms, future, message=message)
+        del self._queues[channel_id]
+        self._workers.pop(channel_id, None)
+    
+    def _finish(self, priority: int, wait_ms: float, future: asyncio.Future, message=None, error: Exception = None):
+        stats = self._stats[priority]
+        stats['wait_ms_total'] += wait_ms
+        stats['wait_ms_max'] = max(stats['wait_ms_max'], wait_ms)
+        stats['failed' if error is not None else 'sent'] += 1
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(message)
+    
+    def metrics(self) -> dict:
+        """Queue depth per channel and sent/failed counts and wait times per priority class"""
+        return {
+            'queue_depth': {channel_id: len(queue) for channel_id, queue in self._queues.items()},
+            'rate_limited': self.rate_limited,
+            'backed_off': {channel_id: f"{limit}/{self.window_seconds:g}" for channel_id, limit in self._channel_limits.items()},
+            'priorities': {
+                PRIORITY_NAMES[priority]: {
+                    'sent': stats['sent'],
+                    'failed': stats['failed'],
+                    'wait_ms_avg': round(stats['wait_ms_total'] / max(1, stats['sent'] + stats['failed']), 1),
+                    'wait_ms_max': round(stats['wait_ms_max'], 1),
+                }
+                for priority, stats in self._stats.items()
+            },
+        }
+
+outbound_dispatcher = OutboundDispatcher(OUTBOUND_CHANNEL_RATE)
+
+async def send_channel_message(channel, priority: int = PRIORITY_NOTIFICATION, **kwargs) -> discord.Message:
+    """Send a message to a channel through the outbound dispatcher"""
+    return await outbound_dispatcher.send(channel, priority, **kwargs)
+
+# ===========================================================================================
+# MEDIA REUSE
+# ===========================================================================================
+
+# Uploads avoided by reusing attachment URLs from an earlier post
+media_reuse_stats = {'reused': 0, 'reuploaded': 0, 'bytes_saved': 0}
+
+def message_image_urls(message) -> Optional[list]:
+    """CDN URLs of a sent message's image attachments in upload order (None if any isn't an image)"""
+    attachments = getattr(message, 'attachments', None) or []
+    if not attachments or any(not (attachment.content_type or "").startswith("image/") for attachment in attachments):
+        return None
+    return [attachment.url for attachment in attachments]
+
+def reupload_files(files: list) -> list:
+    """Fresh discord.File objects over the same buffers (a File can only be sent once)"""
+    files_copy = []
+    for file in files or []:
+        file.fp.seek(0)
+        files_copy.append(discord.File(file.fp, filename=file.filename))
+    return files_copy
+
+def media_gallery_embeds(embed: discord.Embed, image_urls: list, link_url: str) -> list:
+    """embed with the first image, plus image-only embeds sharing link_url so Discord groups them as a gallery"""
+    main_embed = embed.copy()
+    main_embed.url = link_url
+    main_embed.set_image(url=image_urls[0])
+    # A message holds at most 10 embeds; link_url leads to the full set
+    return [main_embed] + [discord.Embed(url=link_url).set_image(url=url) for url in image_urls[1:10]]
+
+async def send_reusing_media(channel, priority: int, reuse_kwargs: Optional[dict], upload_kwargs, upload_bytes: int = 0) -> discord.Message:
+    """
+    Send a message that shows media already uploaded elsewhere.
+    
+    reuse_kwargs references the existing attachment URLs; if it is None or Discord rejects it,
+    upload_kwargs() builds the kwargs that upload the files again.
+    """
+    if reuse_kwargs is not None:
+        try:
+            message = await send_channel_message(channel, priority, **reuse_kwargs)
+            media_reuse_stats['reused'] += 1
+            media_reuse_stats['bytes_saved'] += upload_bytes
+            return message
+        except discord.HTTPException as e:
+            print(f"Could not reuse uploaded media in {getattr(channel, 'name', channel)}, uploading again: {e}")
+    media_reuse_stats['reuploaded'] += 1
+    return await send_channel_message(channel, priority, **upload_kwargs())
+
+# ===========================================================================================
+# FAN-OUT POSTING
+# ===========================================================================================
+
+async def fan_out(branches: dict) -> dict:
+    """
+    Run independent posting branches concurrently with asyncio.gather.
+    
+    branches maps a destination label to an awaitable. A branch fails if it raises or
+    returns a falsy value; one failing branch never stops the others.
+    Returns {label: (success, error message or None)} in the order given.
+    """
+    labels = list(branches)
+    outcomes = await asyncio.gather(*branches.values(), return_exceptions=True)
+    report = {}
+    for label, outcome in zip(labels, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"Fan-out branch '{label}' failed: {outcome!r}")
+            report[label] = (False, str(outcome) or type(outcome).__name__)
+        else:
+            report[label] = (bool(outcome), None if outcome else "not sent")
+    return report
+
+def format_fanout_report(report: dict) -> str:
+    """One line per destination for the followup message"""
+    return "\n".join(
+        f"✅ {label}" if success else f"⚠️ {label}: {error}"
+        for label, (success, error) in report.items()
+    )
+
+# ===========================================================================================
+# SCREENSHOT INGESTION
+# ===========================================================================================
+
+# Result screenshots downloaded at the same time
+SCREENSHOT_FETCH_CONCURRENCY = max(1, int(os.getenv('SCREENSHOT_FETCH_CONCURRENCY', '4')))
+
+# Screenshots larger than this spill from memory to a temporary file while downloading
+SCREENSHOT_SPOOL_MB = float(os.getenv('SCREENSHOT_SPOOL_MB', '2'))
+
+# Total screenshot size accepted per result; screenshots past the budget are skipped (earlier ones win)
+SCREENSHOT_BUDGET_MB = float(os.getenv('SCREENSHOT_BUDGET_MB', '25'))
+
+SCREENSHOT_CHUNK_BYTES = 64 * 1024
+
+def format_megabytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+def buffer_size(fp) -> int:
+    """Size of a seekable file object without moving its position"""
+    position = fp.tell()
+    size = fp.seek(0, io.SEEK_END)
+    fp.seek(position)
+    return size
+
+async def fetch_attachment(session: aiohttp.ClientSession, attachment: discord.Attachment) -> tempfile.SpooledTemporaryFile:
+    """Stream an attachment into a SpooledTemporaryFile that moves to disk past SCREENSHOT_SPOOL_MB"""
+    spool = tempfile.SpooledTemporaryFile(max_size=int(SCREENSHOT_SPOOL_MB * 1024 * 1024))
+    try:
+        async with session.get(attachment.url) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(SCREENSHOT_CHUNK_BYTES):
+                spool.write(chunk)
+        spool.seek(0)
+        return spool
+    except BaseException:
+        spool.close()
+        raise
+
+async def ingest_screenshots(attachments: list) -> tuple[list, list]:
+    """
+    Download result screenshots concurrently (at most SCREENSHOT_FETCH_CONCURRENCY at once).
+    
+    attachments holds the ss_1..ss_11 options in order, None for empty slots.
+    Returns (screenshots, problems): screenshots are dicts with label ("SS-3"), filename,
+    fp (rewound spool), size and fetch time in ms, in slot order; problems are
+    human-readable notes about skipped or failed screenshots.
+    Close the results with close_screenshots().
+    """
+    budget = int(SCREENSHOT_BUDGET_MB * 1024 * 1024)
+    problems = []
+    accepted = []
+    # Reserve the budget in slot order so a big late screenshot never pushes out an earlier one
+    for i, attachment in enumerate(attachments, 1):
+        if not attachment:
+            continue
+        label = f"SS-{i}"
+        if attachment.size > budget:
+            problems.append(f"{label} skipped: {format_megabytes(attachment.size)} is over the remaining {format_megabytes(budget)} screenshot budget")
+            continue
+        budget -= attachment.size
+        accepted.append((label, attachment))
+    if not accepted:
+        return [], problems
+    
+    semaphore = asyncio.Semaphore(SCREENSHOT_FETCH_CONCURRENCY)
+    
+    async def fetch(session, label, attachment):
+        async with semaphore:
+            started = perf_counter()
+            spool = await fetch_attachment(session, attachment)
+            return {
+                'label': label,
+                'filename': f"{label}_{attachment.filename}",
+                'fp': spool,
+                'size': buffer_size(spool),
+                'ms': (perf_counter() - started) * 1000,
+            }
+    
+    started = perf_counter()
+    async with aiohttp.ClientSession() as session:
+        outcomes = await asyncio.gather(
+            *(fetch(session, label, attachment) for label, attachment in accepted),
+            return_exceptions=True
+        )
+    
+    screenshots = []
+    for (label, attachment), outcome in zip(accepted, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"Error fetching screenshot {label} ({attachment.filename}): {type(outcome).__name__}: {outcome}")
+            problems.append(f"{label} could not be downloaded")
+            continue
+        where = "disk" if outcome['size'] > SCREENSHOT_SPOOL_MB * 1024 * 1024 else "memory"
+        print(f"Fetched screenshot {label} ({attachment.filename}): {format_megabytes(outcome['size'])} in {outcome['ms']:.0f} ms ({where})")
+        screenshots.append(outcome)
+    
+    total = sum(screenshot['size'] for screenshot in screenshots)
+    print(f"Fetched {len(screenshots)}/{len(accepted)} screenshot(s), {format_megabytes(total)} in {(perf_counter() - started) * 1000:.0f} ms "
+          f"(concurrency {SCREENSHOT_FETCH_CONCURRENCY})")
+    return screenshots, problems
+
+def screenshot_files(screenshots: list) -> list:
+    """discord.File objects over the downloaded screenshots"""
+    # SpooledTemporaryFile only subclasses IOBase (which discord.File checks for) from Python 3.11
+    return [
+        discord.File(
+            screenshot['fp'] if isinstance(screenshot['fp'], io.IOBase) else screenshot['fp']._file,
+            filename=screenshot['filename']
+        )
+        for screenshot in screenshots
+    ]
+
+def close_screenshots(screenshots: list):
+    """Release screenshot buffers and remove spilled temporary files"""
+    for screenshot in screenshots:
+        fp = screenshot['fp']
+        try:
+            # discord.File stubs out close() on buffers it hasn't sent yet, so call the type's close
+            type(fp).close(fp)
+        except Exception:
+            pass
+
 # ===========================================================================================
 # RESULT MANAGEMENT SYSTEM
 # ===========================================================================================
@@ -139,17 +1275,15 @@ class ResultManager:
         return origin_channel.id != results_channel.id
     
     @staticmethod
-    async def post_result_to_channel(channel: discord.TextChannel, embed: discord.Embed, files: list = None) -> bool:
-        """Post result to a specific channel, returns True if successful"""
+    async def post_result_to_channel(channel: discord.TextChannel, embed: discord.Embed, files: list = None) -> Optional[discord.Message]:
+        """Post result to a specific channel, returns the sent message (None if posting failed)"""
         try:
             if files:
-                await channel.send(embed=embed, files=files)
-            else:
-                await channel.send(embed=embed)
-            return True
+                return await send_channel_message(channel, PRIORITY_RESULT, embed=embed, files=files)
+            return await send_channel_message(channel, PRIORITY_RESULT, embed=embed)
         except Exception as e:
             print(f"Error posting result to channel {channel.name}: {e}")
-            return False
+            return None
     
     @staticmethod
     async def post_result_dual_channel(
@@ -160,37 +1294,40 @@ class ResultManager:
     ) -> tuple[bool, bool]:
         """
         Post result to both origin and results channels with deduplication.
+        Screenshots are uploaded once; the origin copy shows them from the results post.
         Returns (results_channel_success, origin_channel_success)
         """
-        results_success = False
-        origin_success = False
-        
-        # Always post to results channel first
-        try:
-            results_success = await ResultManager.post_result_to_channel(results_channel, embed, files)
-        except Exception as e:
-            print(f"Error posting to results channel: {e}")
+        results_message = await ResultManager.post_result_to_channel(results_channel, embed, files)
+        results_success = results_message is not None
         
         # Post to origin channel only if it's different from results channel
         if ResultManager.should_duplicate_post(origin_channel, results_channel):
-            try:
-                # Create new file objects for the second post (files can only be used once)
-                files_copy = []
-                if files:
-                    for file in files:
-                        # Reset file pointer and create new file object
-                        file.fp.seek(0)
-                        file_copy = discord.File(file.fp, filename=file.filename)
-                        files_copy.append(file_copy)
-                
-                origin_success = await ResultManager.post_result_to_channel(origin_channel, embed, files_copy)
-            except Exception as e:
-                print(f"Error posting to origin channel: {e}")
+            origin_success = await ResultManager.post_origin_copy(results_message, embed, files, origin_channel)
         else:
             # Same channel, so we consider origin posting successful since we already posted to results
             origin_success = results_success
         
         return results_success, origin_success
+    
+    @staticmethod
+    async def post_origin_copy(results_message: Optional[discord.Message], embed: discord.Embed, files: list, origin_channel: discord.TextChannel) -> bool:
+        """Post the origin channel copy, showing screenshots from the results post instead of re-uploading them"""
+        try:
+            if not files:
+                return await ResultManager.post_result_to_channel(origin_channel, embed) is not None
+            # Reuse the screenshots uploaded with the results post as an image gallery
+            image_urls = message_image_urls(results_message)
+            reuse_kwargs = {'embeds': media_gallery_embeds(embed, image_urls, results_message.jump_url)} if image_urls else None
+            upload_bytes = sum(buffer_size(file.fp) for file in files)
+            await send_reusing_media(
+                origin_channel, PRIORITY_RESULT, reuse_kwargs,
+                lambda: {'embed': embed, 'files': reupload_files(files)},
+                upload_bytes
+            )
+            return True
+        except Exception as e:
+            print(f"Error posting to origin channel: {e}")
+            return False
 
 # ===========================================================================================
 # RULE MANAGEMENT SYSTEM
@@ -215,14 +1352,15 @@ def load_rules():
         tournament_rules = {}
 
 def save_rules():
-    """Save rules to persistent storage"""
-    try:
-        with open('tournament_rules.json', 'w', encoding='utf-8') as f:
-            json.dump(tournament_rules, f, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        print(f"Error saving tournament rules: {e}")
-        return False
+    """Queue the rules to be saved to persistent storage (written by persistence_writer)"""
+    persistence_writer.mark_dirty("rules")
+    return True
+
+persistence_writer.register(
+    "rules",
+    lambda: copy.deepcopy(tournament_rules),
+    lambda rules: atomic_write_json('tournament_rules.json', rules, indent=2, ensure_ascii=False)
+)
 
 def get_current_rules():
     """Get current rules content"""
@@ -323,6 +1461,7 @@ def add_judge_assignment(judge_id: int, event_id: str):
     if judge_id not in judge_assignments:
         judge_assignments[judge_id] = []
     judge_assignments[judge_id].append(event_id)
+    persistence_writer.mark_dirty("judge_assignments")
 
 def remove_judge_assignment(judge_id: int, event_id: str):
     """Remove a schedule assignment from a judge"""
@@ -330,6 +1469,7 @@ def remove_judge_assignment(judge_id: int, event_id: str):
         judge_assignments[judge_id].remove(event_id)
         if not judge_assignments[judge_id]:  # Remove empty list
             del judge_assignments[judge_id]
+        persistence_writer.mark_dirty("judge_assignments")
 
 class TakeScheduleButton(View):
     def __init__(self, event_id: str, team1_captain: discord.Member, team2_captain: discord.Member, event_channel: discord.TextChannel = None):
@@ -411,7 +1551,8 @@ class TakeScheduleButton(View):
             
             # Update scheduled events with judge
             if self.event_id in scheduled_events:
-                scheduled_events[self.event_id]['judge'] = self.judge
+                scheduled_events.update_event(self.event_id, judge=self.judge)
+                persist_event(self.event_id)
             
         except Exception as e:
             # Reset flag in case of error
@@ -466,7 +1607,9 @@ class TakeScheduleButton(View):
             embed.set_footer(text="Judge Assignment • ICF Tournament Bot")
             
             # Send notification to the event channel
-            await self.event_channel.send(
+            await send_channel_message(
+                self.event_channel,
+                PRIORITY_NOTIFICATION,
                 content=f"🔔 {judge.mention} {self.team1_captain.mention} {self.team2_captain.mention}",
                 embed=embed
             )
@@ -595,6 +1738,234 @@ async def display_rules(interaction: discord.Interaction):
         print(f"Error displaying rules: {e}")
         await interaction.response.send_message("❌ An error occurred while displaying rules.", ephemeral=False)
 
+# ===========================================================================================
+# TIMER SCHEDULER
+# ===========================================================================================
+
+# Longest the driver sleeps before re-checking the clock (guards against clock jumps and suspend)
+TIMER_MAX_SLEEP_SECONDS = 300
+
+# What to do with jobs that fell due while the bot was offline:
+# "fire" runs all of them, "skip" drops them, "coalesce" runs only the latest one per event
+TIMER_CATCHUP_POLICY = os.environ.get("TIMER_CATCHUP_POLICY", "coalesce").lower()
+
+class TimerScheduler:
+    """
+    One priority queue and one driver task for every delayed job.
+    
+    Jobs are keyed by (kind, event_id) and hold only ids, never discord objects. Scheduling,
+    rescheduling and cancelling are O(log n): replaced or cancelled heap entries are marked dead
+    and skipped when they reach the top. Each kind has an async handler(event_id, payload)
+    registered once; due jobs are handed to it in their own task so a slow handler never
+    delays the next timer. on_change (if set) is called whenever the set of pending jobs
+    changes, so the jobs can be persisted and restored after a restart. wait_ready (if set)
+    is awaited before any handler runs, so jobs that fall due during login wait for the cache.
+    Running handler tasks are kept until they finish, and shutdown() waits for them.
+    """
+    
+    def __init__(self):
+        self._heap = []  # [due_timestamp, sequence, key, payload, alive]
+        self._jobs = {}  # {(kind, event_id): heap entry}
+        self._handlers = {}
+        self._catch_up_windows = {}
+        self._sequence = 0
+        self._wakeup = None
+        self._driver = None
+        self._running = set()  # handler tasks in flight (the loop only keeps weak references)
+        self._restored = False
+        self.on_change = None
+        self.wait_ready = None
+    
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+    
+    def register(self, kind: str, handler, catch_up_window: Optional[float] = None):
+        """Set the handler for a kind; restored jobs more than catch_up_window seconds overdue are dropped"""
+        self._handlers[kind] = handler
+        self._catch_up_windows[kind] = catch_up_window
+    
+    def schedule(self, kind: str, event_id: str, due: datetime.datetime, payload: dict = None):
+        """Schedule (or reschedule) the kind job for event_id at due (naive datetimes are UTC)"""
+        if due.tzinfo is None:
+            due = due.replace(tzinfo=datetime.timezone.utc)
+        self._remove((kind, event_id))
+        self._sequence += 1
+        entry = [due.timestamp(), self._sequence, (kind, event_id), payload or {}, True]
+        self._jobs[(kind, event_id)] = entry
+        heapq.heappush(self._heap, entry)
+        # Wake the driver if this job is now the earliest
+        if self._heap[0] is entry and self._wakeup is not None:
+            self._wakeup.set()
+        self._changed()
+        self.start()
+    
+    def _remove(self, key: tuple) -> bool:
+        entry = self._jobs.pop(key, None)
+        if entry is None:
+            return False
+        entry[4] = False
+        return True
+    
+    def cancel(self, kind: str, event_id: str) -> bool:
+        """Cancel one job; returns whether it was pending"""
+        removed = self._remove((kind, event_id))
+        if removed:
+            self._changed()
+        return removed
+    
+    def cancel_event(self, event_id: str) -> int:
+        """Cancel every job for an event; returns how many were pending"""
+        removed = sum(self._remove((kind, event_id)) for kind in self._handlers)
+        if removed:
+            self._changed()
+        return removed
+    
+    def export_jobs(self) -> list:
+        """Pending jobs as JSON-safe dicts ({kind, event_id, due timestamp, payload})"""
+        return [
+            {'kind': entry[2][0], 'event_id': entry[2][1], 'due': entry[0], 'payload': entry[3]}
+            for entry in self._jobs.values()
+        ]
+    
+    def restore(self, jobs: list, policy: str = "coalesce") -> dict:
+        """
+        Re-arm jobs loaded from storage, once per process.
+        
+        Future jobs are added in one heapify; jobs that fell due while offline are handled by
+        policy and run in due order from a single catch-up task. Jobs scheduled since startup
+        win over stored ones with the same key.
+        """
+        if self._restored:
+            return {}
+        self._restored = True
+        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        overdue = []
+        armed = 0
+        expired = 0
+        for job in jobs:
+            key = (job['kind'], job['event_id'])
+            if key in self._jobs or job['kind'] not in self._handlers:
+                continue
+            if job['due'] <= now:
+                window = self._catch_up_windows.get(job['kind'])
+                if window is not None and now - job['due'] > window:
+                    # Too late to be useful (e.g. a reminder for a match that already started)
+                    expired += 1
+                    continue
+                overdue.append(job)
+                continue
+            self._sequence += 1
+            entry = [job['due'], self._sequence, key, job.get('payload') or {}, True]
+            self._jobs[key] = entry
+            self._heap.append(entry)
+            armed += 1
+        heapq.heapify(self._heap)
+        
+        overdue.sort(key=lambda job: job['due'])
+        if policy == "skip":
+            catch_up = []
+        elif policy == "coalesce":
+            # Only the latest overdue job per event still matters (e.g. a cleanup supersedes its reminder)
+            latest = {job['event_id']: job for job in overdue}
+            catch_up = sorted(latest.values(), key=lambda job: job['due'])
+        else:
+            catch_up = overdue
+        if catch_up:
+            self._spawn(self._catch_up(catch_up))
+        
+        if self._wakeup is not None:
+            self._wakeup.set()
+        self._changed()
+        self.start()
+        return {'armed': armed, 'overdue': len(overdue), 'caught_up': len(catch_up), 'expired': expired}
+    
+    async def _catch_up(self, jobs: list):
+        for job in jobs:
+            await self._fire((job['kind'], job['event_id']), job.get('payload') or {})
+    
+    def due_time(self, kind: str, event_id: str) -> Optional[datetime.datetime]:
+        entry = self._jobs.get((kind, event_id))
+        return datetime.datetime.fromtimestamp(entry[0], datetime.timezone.utc) if entry else None
+    
+    def pending(self) -> list:
+        """Pending jobs, soonest first, as dicts (for introspection and debugging)"""
+        return [
+            {
+                'kind': entry[2][0],
+                'event_id': entry[2][1],
+                'due': datetime.datetime.fromtimestamp(entry[0], datetime.timezone.utc),
+                'payload': entry[3],
+            }
+            for entry in sorted(self._jobs.values())
+        ]
+    
+    def __len__(self):
+        return len(self._jobs)
+    
+    def start(self):
+        """Start the driver task if it isn't running (needs a running event loop)"""
+        if self._driver is not None and not self._driver.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wakeup = asyncio.Event()
+        self._driver = asyncio.create_task(self._run())
+    
+    async def _run(self):
+        while True:
+            # Drop dead entries left by cancels and reschedules
+            while self._heap and not self._heap[0][4]:
+                heapq.heappop(self._heap)
+            
+            now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+            if self._heap and self._heap[0][0] <= now:
+                _, _, key, payload, _ = heapq.heappop(self._heap)
+                del self._jobs[key]
+                self._changed()
+                self._spawn(self._fire(key, payload))
+                continue
+            
+            timeout = min(self._heap[0][0] - now, TIMER_MAX_SLEEP_SECONDS) if self._heap else TIMER_MAX_SLEEP_SECONDS
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        return task
+    
+    async def shutdown(self, grace: float = 5.0):
+        """Stop the driver, give running handlers grace seconds to finish, then cancel the rest"""
+        if self._driver is not None:
+            self._driver.cancel()
+            self._driver = None
+        if not self._running:
+            return
+        _, unfinished = await asyncio.wait(set(self._running), timeout=grace)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+            print(f"Timer scheduler: cancelled {len(unfinished)} job(s) still running at shutdown")
+    
+    async def _fire(self, key: tuple, payload: dict):
+        kind, event_id = key
+        try:
+            if self.wait_ready is not None:
+                await self.wait_ready()
+            await self._handlers[kind](event_id, payload)
+        except Exception as e:
+            print(f"Error in {kind} job for event {event_id}: {e}")
+
+timer_scheduler = TimerScheduler()
+
 # ===========================================================================================
 # NOTIFICATION AND REMINDER SYSTEM (Ten-minute reminder for captains and judge)
 # ===========================================================================================
@@ -633,190 +2004,334 @@ async def send_ten_minute_reminder(event_id: str, team1_captain: discord.Member,
             pings = f"{resolved_judge.mention} " + pings
         notification_text = f"🔔 **MATCH REMINDER**\n\n{pings}\n\nYour match starts in **10 minutes**!"
 
-        await event_channel.send(content=notification_text, embed=embed)
+        await send_channel_message(event_channel, PRIORITY_REMINDER, content=notification_text, embed=embed)
         print(f"10-minute reminder sent for event {event_id}")
     except Exception as e:
         print(f"Error sending 10-minute reminder for event {event_id}: {e}")
 
 
-async def schedule_ten_minute_reminder(event_id: str, team1_captain: discord.Member, team2_captain: discord.Member, judge: Optional[discord.Member], event_channel: discord.TextChannel, match_time: datetime.datetime):
+async def resolve_event_member(channel, event_data: dict, field: str) -> Optional[discord.Member]:
+    """The member stored on an event, looked up by id if only the id is known"""
+    member = event_data.get(field)
+    if member is not None:
+        return member
+    member_id = event_data.get(f"{field}_id")
+    if not member_id or channel is None:
+        return None
+    member = channel.guild.get_member(member_id)
+    if member is None:
+        try:
+            member = await channel.guild.fetch_member(member_id)
+        except discord.HTTPException:
+            return None
+    return member
+
+async def run_ten_minute_reminder(event_id: str, payload: dict):
+    """Timer handler: send the 10-minute reminder for an event that still exists"""
+    event_data = scheduled_events.get(event_id)
+    if not event_data:
+        return
+    event_channel = bot.get_channel(event_data.get('channel_id'))
+    if event_channel is None:
+        print(f"Channel for event {event_id} not found, skipping reminder")
+        return
+    team1_captain = await resolve_event_member(event_channel, event_data, 'team1_captain')
+    team2_captain = await resolve_event_member(event_channel, event_data, 'team2_captain')
+    if not team1_captain or not team2_captain:
+        print(f"Captains for event {event_id} not found, skipping reminder")
+        return
+    judge = await resolve_event_member(event_channel, event_data, 'judge')
+    match_time = event_data['datetime']
+    if match_time.tzinfo is None:
+        match_time = match_time.replace(tzinfo=pytz.UTC)
+    await send_ten_minute_reminder(event_id, team1_captain, team2_captain, judge, event_channel, match_time)
+
+async def schedule_ten_minute_reminder(event_id: str, match_time: datetime.datetime):
     """Schedule a 10-minute reminder for the match"""
     try:
-        # Calculate when to send the 10-minute reminder
-        reminder_time = match_time - datetime.timedelta(minutes=10)
-        now = datetime.datetime.now(pytz.UTC)
-
-        # Ensure match_time and reminder_time are timezone-aware UTC
+        # Ensure match_time is timezone-aware UTC
         if match_time.tzinfo is None:
             match_time = match_time.replace(tzinfo=pytz.UTC)
-            reminder_time = match_time - datetime.timedelta(minutes=10)
+
+        # Calculate when to send the 10-minute reminder
+        reminder_time = match_time - datetime.timedelta(minutes=10)
 
         # Check if reminder time is in the future
-        if reminder_time <= now:
+        if reminder_time <= datetime.datetime.now(pytz.UTC):
             print(f"Reminder time for event {event_id} is in the past, skipping")
             return
 
-        # Calculate delay in seconds
-        delay_seconds = (reminder_time - now).total_seconds()
-
-        async def reminder_task():
-            try:
-                await asyncio.sleep(delay_seconds)
-                await send_ten_minute_reminder(event_id, team1_captain, team2_captain, judge, event_channel, match_time)
-            except asyncio.CancelledError:
-                print(f"Reminder task for event {event_id} was cancelled")
-            except Exception as e:
-                print(f"Error in reminder task for event {event_id}: {e}")
-
-        # Cancel existing reminder if any
-        if event_id in reminder_tasks:
-            reminder_tasks[event_id].cancel()
-
-        # Schedule new reminder
-        reminder_tasks[event_id] = asyncio.create_task(reminder_task())
+        timer_scheduler.schedule("reminder", event_id, reminder_time)
         print(f"10-minute reminder scheduled for event {event_id} at {reminder_time}")
     except Exception as e:
         print(f"Error scheduling 10-minute reminder for event {event_id}: {e}")
 
 
-async def schedule_event_reminder_v2(event_id: str, team1_captain: discord.Member, team2_captain: discord.Member, judge: Optional[discord.Member], event_channel: discord.TextChannel):
+async def schedule_event_reminder_v2(event_id: str):
     """Schedule event reminder with 10-minute notification using stored event datetime"""
     try:
         if event_id not in scheduled_events:
             print(f"Event {event_id} not found in scheduled_events")
             return
-        event_data = scheduled_events[event_id]
-        match_time = event_data.get('datetime')
+        match_time = scheduled_events[event_id].get('datetime')
         if not match_time:
             print(f"No datetime found for event {event_id}")
             return
-        # Ensure timezone-aware UTC
-        if match_time.tzinfo is None:
-            match_time = match_time.replace(tzinfo=pytz.UTC)
-        await schedule_ten_minute_reminder(event_id, team1_captain, team2_captain, judge, event_channel, match_time)
+        await schedule_ten_minute_reminder(event_id, match_time)
     except Exception as e:
         print(f"Error in schedule_event_reminder_v2 for event {event_id}: {e}")
 
+async def run_event_cleanup(event_id: str, payload: dict):
+    """Timer handler: remove a finished event, its schedule message and its judge assignment"""
+    data = scheduled_events.get(event_id)
+    if not data:
+        return
+    # Delete original schedule message if known
+    try:
+        guilds = bot.guilds
+        for guild in guilds:
+            ch_id = data.get('schedule_channel_id')
+            msg_id = data.get('schedule_message_id')
+            if ch_id and msg_id:
+                channel = guild.get_channel(ch_id)
+                if channel:
+                    try:
+                        msg = await channel.fetch_message(msg_id)
+                        await msg.delete()
+                    except discord.NotFound:
+                        pass
+                    except Exception as e:
+                        print(f"Error deleting schedule message for {event_id}: {e}")
+    except Exception as e:
+        print(f"Guild/channel fetch error during cleanup for {event_id}: {e}")
+
+    # Clean up poster file left by events created before in-memory posters
+    try:
+        poster_path = data.get('poster_path')
+        if poster_path and os.path.exists(poster_path):
+            os.remove(poster_path)
+    except Exception as e:
+        print(f"Poster cleanup error for {event_id}: {e}")
+
+    # Remove any pending reminder
+    timer_scheduler.cancel("reminder", event_id)
+
+    # Finally remove from scheduled events, release the judge and persist
+    try:
+        if event_id in scheduled_events:
+            judge_id = event_member_id(scheduled_events[event_id], 'judge')
+            if judge_id:
+                remove_judge_assignment(judge_id, event_id)
+            del scheduled_events[event_id]
+            persist_event(event_id)
+    except Exception as e:
+        print(f"Error removing event {event_id} in cleanup: {e}")
+
 async def schedule_event_cleanup(event_id: str, delay_hours: int = 36):
     """Schedule cleanup to remove an event after delay_hours (default 36h)."""
     try:
         if event_id not in scheduled_events:
             return
-        delay_seconds = delay_hours * 3600
+        due = datetime.datetime.now(pytz.UTC) + datetime.timedelta(hours=delay_hours)
+        timer_scheduler.schedule("cleanup", event_id, due)
+        print(f"Cleanup scheduled for event {event_id} in {delay_hours} hours")
+    except Exception as e:
+        print(f"Error scheduling cleanup for event {event_id}: {e}")
 
-        async def cleanup_task():
-            try:
-                await asyncio.sleep(delay_seconds)
-                data = scheduled_events.get(event_id)
-                if not data:
-                    return
-                # Delete original schedule message if known
-                try:
-                    guilds = bot.guilds
-                    for guild in guilds:
-                        ch_id = data.get('schedule_channel_id')
-                        msg_id = data.get('schedule_message_id')
-                        if ch_id and msg_id:
-                            channel = guild.get_channel(ch_id)
-                            if channel:
-                                try:
-                                    msg = await channel.fetch_message(msg_id)
-                                    await msg.delete()
-                                except discord.NotFound:
-                                    pass
-                                except Exception as e:
-                                    print(f"Error deleting schedule message for {event_id}: {e}")
-                except Exception as e:
-                    print(f"Guild/channel fetch error during cleanup for {event_id}: {e}")
-
-                # Clean up poster file if any
-                try:
-                    poster_path = data.get('poster_path')
-                    if poster_path and os.path.exists(poster_path):
-                        os.remove(poster_path)
-                except Exception as e:
-                    print(f"Poster cleanup error for {event_id}: {e}")
+# A reminder is only useful until the match starts, 10 minutes after it falls due
+timer_scheduler.register("reminder", run_ten_minute_reminder, catch_up_window=10 * 60)
+timer_scheduler.register("cleanup", run_event_cleanup)
 
-                # Remove any reminder task
-                try:
-                    if event_id in reminder_tasks:
-                        reminder_tasks[event_id].cancel()
-                        del reminder_tasks[event_id]
-                except Exception:
-                    pass
+# Jobs restored in setup_hook run before the gateway connects; handlers need channels and guilds
+timer_scheduler.wait_ready = bot.wait_until_ready
 
-                # Finally remove from scheduled events and persist
-                try:
-                    if event_id in scheduled_events:
-                        del scheduled_events[event_id]
-                        save_scheduled_events()
-                except Exception as e:
-                    print(f"Error removing event {event_id} in cleanup: {e}")
-            except asyncio.CancelledError:
-                print(f"Cleanup task for event {event_id} was cancelled")
-            except Exception as e:
-                print(f"Error in cleanup task for event {event_id}: {e}")
+# Persist pending timers through the background writer
+timer_scheduler.on_change = lambda: persistence_writer.mark_dirty("timer_jobs")
+persistence_writer.register("timer_jobs", timer_scheduler.export_jobs, lambda jobs: get_event_store().save_timer_jobs(jobs))
 
-        # Cancel existing cleanup if any and schedule new
-        if event_id in cleanup_tasks:
-            try:
-                cleanup_tasks[event_id].cancel()
-            except Exception:
-                pass
+async def load_timer_jobs():
+    """Re-arm reminders and cleanups saved before the last shutdown"""
+    try:
+        start = perf_counter()
+        jobs = await persistence_writer.run(lambda: get_event_store().load_timer_jobs())
+        stats = timer_scheduler.restore(jobs, TIMER_CATCHUP_POLICY)
+        if stats:
+            print(f"Restored {stats['armed']} timer job(s), {stats['overdue']} overdue ({TIMER_CATCHUP_POLICY}: {stats['caught_up']} run), "
+                  f"{stats['expired']} expired in {(perf_counter() - start) * 1000:.1f}ms")
+    except Exception as e:
+        print(f"Error restoring timer jobs: {e}")
 
-        cleanup_tasks[event_id] = asyncio.create_task(cleanup_task())
-        print(f"Cleanup scheduled for event {event_id} in {delay_hours} hours")
+# ===========================================================================================
+# FONT CACHE SYSTEM
+# ===========================================================================================
+
+# Root directory for on-disk caches (fonts, templates, posters)
+CACHE_DIR = Path(os.environ.get("ICF_CACHE_DIR", ".cache"))
+
+# Content-addressed store for downloaded Google Fonts
+FONT_CACHE_DIR = CACHE_DIR / "fonts"
+FONT_CACHE_INDEX = FONT_CACHE_DIR / "index.json"
+
+# Offline mode never touches the network; only fonts already in the disk cache are used
+FONT_OFFLINE_MODE = os.environ.get("FONT_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# Maximum number of loaded FreeTypeFont objects kept in memory
+FONT_LRU_SIZE = int(os.environ.get("FONT_LRU_SIZE", "32"))
+
+# Local bundled fonts, tried after Google Fonts
+LOCAL_FONT_PATHS = [
+    str(Path("Fonts") / "capture_it" / "Capture it.ttf"),
+    str(Path("Fonts") / "ds_digital" / "DS-DIGIB.TTF"),
+    str(Path("Fonts") / "ds_digital" / "DS-DIGII.TTF"),
+    str(Path("Fonts") / "ds_digital" / "DS-DIGI.TTF"),
+]
+
+# System fonts, tried last
+SYSTEM_FONT_PATHS = [
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/arialbd.ttf",
+    "C:/Windows/Fonts/impact.ttf",
+    "C:/Windows/Fonts/consola.ttf",
+    "C:/Windows/Fonts/trebucbd.ttf",
+]
+
+# Google Fonts families used by the poster renderer: (family, style)
+POSTER_FONT_FAMILIES = [
+    ("Orbitron", "bold"),
+    ("Capture it", "bold"),
+    ("Share Tech Mono", "regular"),
+    ("Roboto", "regular"),
+]
+
+# Seconds before a failed Google Fonts download is tried again
+FONT_RETRY_SECONDS = int(os.environ.get("FONT_RETRY_SECONDS", "300"))
+
+# Resolved font paths per (family, style, weight) for this process; None means "not available" (offline mode)
+_font_path_memo = {}
+# Failed downloads per (family, style, weight): perf_counter time after which they are retried
+_font_retry_after = {}
+_font_cache_lock = threading.Lock()
+
+def _font_cache_key(font_family: str, font_style: str, font_weight: str) -> str:
+    """Build the index key for a font request"""
+    return f"{font_family}|{font_style}|{font_weight}"
+
+def _load_font_cache_index() -> dict:
+    """Load the on-disk font index mapping request keys to content-addressed files"""
+    try:
+        if FONT_CACHE_INDEX.exists():
+            with open(FONT_CACHE_INDEX, 'r', encoding='utf-8') as f:
+                return json.load(f)
     except Exception as e:
-        print(f"Error scheduling cleanup for event {event_id}: {e}")
+        print(f"Error loading font cache index: {e}")
+    return {}
+
+def _save_font_cache_index(index: dict):
+    """Atomically persist the on-disk font index"""
+    try:
+        FONT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Per-process temp name: render workers and the bot can save the index at the same time
+        tmp_path = FONT_CACHE_INDEX.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, FONT_CACHE_INDEX)
+    except Exception as e:
+        print(f"Error saving font cache index: {e}")
+
+def _store_font_bytes(content: bytes, suffix: str) -> str:
+    """Store font bytes under their SHA-256 digest and return the file path"""
+    digest = hashlib.sha256(content).hexdigest()
+    FONT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    font_path = FONT_CACHE_DIR / f"{digest}{suffix}"
+    if not font_path.exists():
+        tmp_path = font_path.with_suffix(f"{font_path.suffix}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, font_path)
+    return str(font_path)
 
 # Google Fonts API Integration
 def download_google_font(font_family: str, font_style: str = "regular", font_weight: str = "400") -> str:
-    """Download a font from Google Fonts API and return the local file path"""
-    try:
-        # Google Fonts API URL
-        api_url = f"https://fonts.googleapis.com/css2?family={font_family.replace(' ', '+')}:wght@{font_weight}"
-        
-        # Add style parameter if not regular
-        if font_style != "regular":
-            api_url += f"&style={font_style}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(api_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse CSS to get font URL
-        css_content = response.text
-        font_urls = re.findall(r'url\((https://[^)]+\.woff2?)\)', css_content)
-        
-        if not font_urls:
-            print(f"No font URLs found in CSS for {font_family}")
+    """Return a local path for a Google Font, downloading it into the disk cache on first use"""
+    key = _font_cache_key(font_family, font_style, font_weight)
+    if key in _font_path_memo:
+        return _font_path_memo[key]
+
+    with _font_cache_lock:
+        if key in _font_path_memo:
+            return _font_path_memo[key]
+
+        # Check the persistent content-addressed cache first
+        index = _load_font_cache_index()
+        cached_path = index.get(key)
+        if cached_path and os.path.exists(cached_path):
+            _font_path_memo[key] = cached_path
+            return cached_path
+
+        if FONT_OFFLINE_MODE:
+            _font_path_memo[key] = None
             return None
-        
-        # Download the first font file (usually woff2)
-        font_url = font_urls[0]
-        font_response = requests.get(font_url, timeout=15)
-        font_response.raise_for_status()
-        
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.woff2')
-        temp_file.write(font_response.content)
-        temp_file.close()
-        
-        print(f"Downloaded Google Font: {font_family} -> {temp_file.name}")
-        return temp_file.name
-        
-    except Exception as e:
-        print(f"Error downloading Google Font {font_family}: {e}")
-        return None
 
-def get_font_with_fallbacks(font_name: str, size: int, font_style: str = "regular") -> ImageFont.FreeTypeFont:
+        # Don't hit the network on every poster while a recent download attempt failed
+        if perf_counter() < _font_retry_after.get(key, 0.0):
+            return None
+
+        try:
+            # Google Fonts API URL
+            api_url = f"https://fonts.googleapis.com/css2?family={font_family.replace(' ', '+')}:wght@{font_weight}"
+            
+            # Add style parameter if not regular
+            if font_style != "regular":
+                api_url += f"&style={font_style}"
+            
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+            
+            response = requests.get(api_url, headers=headers, timeout=10)
+            response.raise_for_status()
+            
+            # Parse CSS to get font URL
+            css_content = response.text
+            font_urls = re.findall(r'url\((https://[^)]+\.woff2?)\)', css_content)
+            
+            if not font_urls:
+                print(f"No font URLs found in CSS for {font_family}")
+                _font_retry_after[key] = perf_counter() + FONT_RETRY_SECONDS
+                return None
+            
+            # Download the first font file (usually woff2)
+            font_url = font_urls[0]
+            font_response = requests.get(font_url, timeout=15)
+            font_response.raise_for_status()
+            
+            font_path = _store_font_bytes(font_response.content, os.path.splitext(font_url)[1])
+            index[key] = font_path
+            _save_font_cache_index(index)
+            _font_path_memo[key] = font_path
+            _font_retry_after.pop(key, None)
+            
+            print(f"Downloaded Google Font: {font_family} -> {font_path}")
+            return font_path
+            
+        except Exception as e:
+            # Back off for FONT_RETRY_SECONDS instead of disabling the font until restart
+            print(f"Error downloading Google Font {font_family}: {e} (retrying in {FONT_RETRY_SECONDS}s)")
+            _font_retry_after[key] = perf_counter() + FONT_RETRY_SECONDS
+            return None
+
+@functools.lru_cache(maxsize=FONT_LRU_SIZE)
+def load_truetype_cached(font_path: str, size: int) -> "ImageFont.FreeTypeFont":
+    """Load a FreeType font, keeping recently used (path, size) pairs in memory"""
+    font = ImageFont.truetype(font_path, size)
+    print(f"Successfully loaded font: {font_path}")
+    return font
+
+def get_font_with_fallbacks(font_name: str, size: int, font_style: str = "regular") -> "ImageFont.FreeTypeFont":
     """Get a font with multiple fallback options including Google Fonts"""
     font_candidates = []
     
-    # 1. Try Google Fonts first
+    # 1. Try Google Fonts first (served from the disk cache after the first download)
     try:
         google_font_path = download_google_font(font_name, font_style)
         if google_font_path:
@@ -825,31 +2340,16 @@ def get_font_with_fallbacks(font_name: str, size: int, font_style: str = "regula
         print(f"Google Fonts failed for {font_name}: {e}")
     
     # 2. Try local bundled fonts
-    local_fonts = [
-        str(Path("Fonts") / "capture_it" / "Capture it.ttf"),
-        str(Path("Fonts") / "ds_digital" / "DS-DIGIB.TTF"),
-        str(Path("Fonts") / "ds_digital" / "DS-DIGII.TTF"),
-        str(Path("Fonts") / "ds_digital" / "DS-DIGI.TTF"),
-    ]
-    font_candidates.extend(local_fonts)
+    font_candidates.extend(LOCAL_FONT_PATHS)
     
     # 3. Try system fonts
-    system_fonts = [
-        "C:/Windows/Fonts/arial.ttf",
-        "C:/Windows/Fonts/arialbd.ttf", 
-        "C:/Windows/Fonts/impact.ttf",
-        "C:/Windows/Fonts/consola.ttf",
-        "C:/Windows/Fonts/trebucbd.ttf",
-    ]
-    font_candidates.extend(system_fonts)
+    font_candidates.extend(SYSTEM_FONT_PATHS)
     
     # Try each font candidate
     for font_path in font_candidates:
         try:
             if os.path.exists(font_path):
-                font = ImageFont.truetype(font_path, size)
-                print(f"Successfully loaded font: {font_path}")
-                return font
+                return load_truetype_cached(font_path, size)
         except Exception as e:
             print(f"Failed to load font {font_path}: {e}")
             continue
@@ -861,347 +2361,1748 @@ def get_font_with_fallbacks(font_name: str, size: int, font_style: str = "regula
     except:
         return ImageFont.load_default()
 
+# ===========================================================================================
+# UNICODE FONT FALLBACK
+# ===========================================================================================
+
+# Fonts tried, in order, for characters the poster font has no glyph for (missing files are skipped).
+# Extra fonts can be put in front with POSTER_FALLBACK_FONTS (os.pathsep-separated paths).
+UNICODE_FALLBACK_FONT_PATHS = [
+    path for path in os.environ.get("POSTER_FALLBACK_FONTS", "").split(os.pathsep) if path
+] + [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSans-Bold.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "C:/Windows/Fonts/arialbd.ttf",
+    "C:/Windows/Fonts/segoeuib.ttf",
+    "C:/Windows/Fonts/msyhbd.ttc",
+    "C:/Windows/Fonts/meiryob.ttc",
+    "C:/Windows/Fonts/malgunbd.ttf",
+    "C:/Windows/Fonts/seguisym.ttf",
+]
+
+# Printable ASCII, assumed when a font's cmap can't be read (e.g. compressed WOFF2 downloads)
+ASCII_COVERAGE = frozenset(range(0x20, 0x7F))
+
+def _parse_cmap_coverage(data: bytes) -> frozenset:
+    """Read the codepoints mapped to real glyphs from a TrueType/OpenType (or TTC) font's cmap table"""
+    offset = 0
+    if data[:4] == b'ttcf':
+        # Font collection: use the first font
+        offset = struct.unpack('>I', data[12:16])[0]
+    if data[offset:offset + 4] in (b'wOFF', b'wOF2'):
+        raise ValueError("compressed web font")
+
+    num_tables = struct.unpack('>H', data[offset + 4:offset + 6])[0]
+    cmap_offset = None
+    for i in range(num_tables):
+        record = offset + 12 + 16 * i
+        if data[record:record + 4] == b'cmap':
+            cmap_offset = struct.unpack('>I', data[record + 8:record + 12])[0]
+            break
+    if cmap_offset is None:
+        raise ValueError("no cmap table")
+
+    # Pick the widest Unicode subtable: full-repertoire format 12 first, then BMP format 4
+    subtables = {}
+    num_subtables = struct.unpack('>H', data[cmap_offset + 2:cmap_offset + 4])[0]
+    for i in range(num_subtables):
+        platform_id, encoding_id, sub_offset = struct.unpack('>HHI', data[cmap_offset + 4 + 8 * i:cmap_offset + 12 + 8 * i])
+        sub_start = cmap_offset + sub_offset
+        sub_format = struct.unpack('>H', data[sub_start:sub_start + 2])[0]
+        if platform_id == 0 or (platform_id == 3 and encoding_id in (1, 10)):
+            subtables.setdefault(sub_format, sub_start)
+
+    codepoints = set()
+    if 12 in subtables:
+        start = subtables[12]
+        num_groups = struct.unpack('>I', data[start + 12:start + 16])[0]
+        for i in range(num_groups):
+            first, last, start_glyph = struct.unpack('>III', data[start + 16 + 12 * i:start + 28 + 12 * i])
+            codepoints.update(range(first + (1 if start_glyph == 0 else 0), last + 1))
+    elif 4 in subtables:
+        start = subtables[4]
+        seg_count = struct.unpack('>H', data[start + 6:start + 8])[0] // 2
+        ends_at = start + 14
+        starts_at = ends_at + 2 * seg_count + 2
+        deltas_at = starts_at + 2 * seg_count
+        range_offsets_at = deltas_at + 2 * seg_count
+        for seg in range(seg_count):
+            end = struct.unpack('>H', data[ends_at + 2 * seg:ends_at + 2 * seg + 2])[0]
+            first = struct.unpack('>H', data[starts_at + 2 * seg:starts_at + 2 * seg + 2])[0]
+            delta = struct.unpack('>h', data[deltas_at + 2 * seg:deltas_at + 2 * seg + 2])[0]
+            range_offset_pos = range_offsets_at + 2 * seg
+            range_offset = struct.unpack('>H', data[range_offset_pos:range_offset_pos + 2])[0]
+            for codepoint in range(first, min(end, 0xFFFE) + 1):
+                if range_offset == 0:
+                    glyph = (codepoint + delta) & 0xFFFF
+                else:
+                    glyph_pos = range_offset_pos + range_offset + 2 * (codepoint - first)
+                    glyph = struct.unpack('>H', data[glyph_pos:glyph_pos + 2])[0]
+                    if glyph:
+                        glyph = (glyph + delta) & 0xFFFF
+                if glyph:
+                    codepoints.add(codepoint)
+    else:
+        raise ValueError("no Unicode cmap subtable")
+    return frozenset(codepoints)
+
+@functools.lru_cache(maxsize=None)
+def get_font_coverage(font_path: str) -> frozenset:
+    """Set of codepoints a font file has glyphs for, computed once per font"""
+    try:
+        with open(font_path, 'rb') as f:
+            return _parse_cmap_coverage(f.read())
+    except Exception as e:
+        print(f"Could not read glyph coverage for {font_path}, assuming ASCII: {e}")
+        return ASCII_COVERAGE
+
+def get_fallback_font_chain(primary_font_path: Optional[str]) -> tuple:
+    """Font paths to try for each character: the poster font first, then installed fallbacks"""
+    chain = [primary_font_path] if isinstance(primary_font_path, str) else []
+    chain.extend(path for path in UNICODE_FALLBACK_FONT_PATHS if path not in chain and os.path.exists(path))
+    return tuple(chain)
+
+@functools.lru_cache(maxsize=1024)
+def segment_text_runs(text: str, font_chain: tuple) -> tuple:
+    """Split text into (run_text, font_path) runs, each character in the first font that covers it.
+
+    Whitespace stays in the current run. Characters no font covers are dropped.
+    """
+    coverages = [(path, get_font_coverage(path)) for path in font_chain]
+    runs = []
+    for ch in text:
+        codepoint = ord(ch)
+        if ch.isspace() and runs:
+            path = runs[-1][1]
+        else:
+            path = next((font_path for font_path, coverage in coverages if codepoint in coverage), None)
+            if path is None:
+                continue
+        if runs and runs[-1][1] == path:
+            runs[-1][0].append(ch)
+        else:
+            runs.append(([ch], path))
+    return tuple(("".join(chars), path) for chars, path in runs if "".join(chars).strip())
+
+def preload_font_coverage(primary_font_path: Optional[str]):
+    """Build coverage indexes for the whole fallback chain ahead of the first render"""
+    for path in get_fallback_font_chain(primary_font_path):
+        get_font_coverage(path)
+
+def warm_font_cache():
+    """Download every poster font family into the disk cache so later renders can run offline"""
+    for family, style in POSTER_FONT_FAMILIES:
+        path = download_google_font(family, style)
+        print(f"Font cache warmup: {family} ({style}) -> {path or 'fallback'}")
+
+def load_poster_fonts(height: int) -> tuple:
+    """Load the (title, round, vs, time, tiny) poster fonts sized for an image height"""
+    # Define font sizes based on image height (reduced for better fit)
+    title_size = int(height * 0.10)
+    round_size = int(height * 0.14)
+    vs_size = int(height * 0.09)
+    time_size = int(height * 0.07)
+    tiny_size = int(height * 0.05)
+    
+    # Try Google Fonts first, then fallback to local/system fonts
+    font_title = get_font_with_fallbacks("Orbitron", title_size, "bold")  # Modern display font
+    font_round = get_font_with_fallbacks("Orbitron", round_size, "bold")  # Same for round
+    # Use a unique bundled font for player names so styling is consistent regardless of Discord nickname styling
+    font_vs = get_font_with_fallbacks("Capture it", vs_size, "bold")       # Unique display font from Fonts/capture_it
+    font_time = get_font_with_fallbacks("Share Tech Mono", time_size)     # Monospace for time
+    font_tiny = get_font_with_fallbacks("Roboto", tiny_size)              # Small text
+    return font_title, font_round, font_vs, font_time, font_tiny
+
 def sanitize_username_for_poster(username: str) -> str:
-    """Convert Discord display names to poster-friendly ASCII by stripping emojis and fancy Unicode.
+    """Convert Discord display names to poster-friendly text.
 
-    - Normalizes to NFKD and drops non-ASCII codepoints
+    - Normalizes to NFKC so styled letters (bold/script/fullwidth) become plain letters,
+      while accented, Cyrillic and CJK characters are kept for the Unicode font fallback
+    - Drops control, format (zero-width) and other non-printable characters
     - Collapses repeated whitespace and trims ends
     - Falls back to 'Player' if empty after sanitization
     """
     try:
-        import unicodedata
-        # Normalize and strip accents/fancy letters
-        normalized = unicodedata.normalize('NFKD', str(username))
-        ascii_only = normalized.encode('ascii', 'ignore').decode('ascii')
-        # Remove remaining characters that might be control or non-printable
-        ascii_only = re.sub(r"[^\x20-\x7E]", "", ascii_only)
+        normalized = unicodedata.normalize('NFKC', str(username))
+        printable = "".join(ch for ch in normalized if ch.isprintable() or ch.isspace())
         # Collapse whitespace
-        ascii_only = re.sub(r"\s+", " ", ascii_only).strip()
-        return ascii_only if ascii_only else "Player"
+        printable = re.sub(r"\s+", " ", printable).strip()
+        return printable if printable else "Player"
     except Exception:
         return str(username) if username else "Player"
 
-def get_random_template():
-    """Get a random template image from the Templates folder"""
-    template_path = "Templates"
-    if os.path.exists(template_path):
-        # Get all image files
-        image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.gif']
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(template_path, ext)))
-            image_files.extend(glob.glob(os.path.join(template_path, ext.upper())))
+# ===========================================================================================
+# TEMPLATE CACHE SYSTEM
+# ===========================================================================================
+
+# Folder holding poster background templates
+TEMPLATE_DIR = "Templates"
+
+# Decoded, downscaled templates persisted as raw RGBA files
+TEMPLATE_CACHE_DIR = CACHE_DIR / "templates"
+
+# Maximum number of decoded templates kept in memory (each is at most 800x600 RGBA, ~1.9 MB)
+TEMPLATE_MEMORY_CACHE_SIZE = int(os.environ.get("TEMPLATE_MEMORY_CACHE_SIZE", "8"))
+
+TEMPLATE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif')
+
+# Template listing, refreshed when the Templates folder mtime changes: (mtime_ns, [paths])
+_template_listing = (None, [])
+
+# Decoded templates keyed by path: {path: (mtime_ns, Image)}
+_template_images = collections.OrderedDict()
+_template_cache_lock = threading.Lock()
+
+def list_templates() -> list:
+    """List template images, rescanning the Templates folder only when it changes"""
+    global _template_listing
+    try:
+        dir_mtime = os.stat(TEMPLATE_DIR).st_mtime_ns
+    except OSError:
+        return []
+
+    if _template_listing[0] != dir_mtime:
+        image_files = sorted(
+            os.path.join(TEMPLATE_DIR, name)
+            for name in os.listdir(TEMPLATE_DIR)
+            if name.lower().endswith(TEMPLATE_EXTENSIONS)
+        )
+        _template_listing = (dir_mtime, image_files)
+    return _template_listing[1]
+
+def _template_raw_prefix(template_path: str) -> str:
+    """Stable cache file prefix for a template path"""
+    return hashlib.sha1(os.path.abspath(template_path).encode('utf-8')).hexdigest()
+
+def _decode_template(template_path: str) -> "Image.Image":
+    """Decode a template, convert to RGBA and downscale it to poster size"""
+    with Image.open(template_path) as img:
+        print(f"Decoding template image: {template_path} {img.size}, mode: {img.mode}")
         
-        if image_files:
-            return random.choice(image_files)
-    return None
+        # Convert to RGBA if needed
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        else:
+            img.load()
+        
+        # Resize image to be smaller (max 800x600 to avoid Discord size limits)
+        new_size = get_poster_size(img.size)
+        if new_size != img.size:
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+        return img
 
-def create_event_poster(template_path: str, round_num: int, team1_captain: str, team2_captain: str, utc_time: str, date_str: str = None, tournament_name: str = "ICF Tournament", server_name: str = "ICF Tournament Bot") -> str:
-    """Create event poster with text overlays using Google Fonts and improved error handling"""
-    print(f"Creating poster with template: {template_path}")
-    
+def _load_template_raw(raw_path: Path, size: tuple) -> "Image.Image":
+    """Memory-map a raw RGBA template file as a read-only image"""
+    with open(raw_path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return Image.frombuffer('RGBA', size, buffer, 'raw', 'RGBA', 0, 1)
+
+def _store_template_raw(template_path: str, mtime_ns: int, img: "Image.Image"):
+    """Persist a decoded template as raw RGBA and drop raw files from older versions"""
     try:
-        # Validate template path
-        if not os.path.exists(template_path):
-            print(f"Template file not found: {template_path}")
-            return None
-            
-        # Open the template image
-        with Image.open(template_path) as img:
-            print(f"Opened template image: {img.size}, mode: {img.mode}")
-            
-            # Convert to RGBA if needed
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-            
-            # Resize image to be smaller (max 800x600 to avoid Discord size limits)
-            max_width, max_height = 800, 600
-            width, height = img.size
-            
-            # Calculate new dimensions while maintaining aspect ratio
-            if width > max_width or height > max_height:
-                ratio = min(max_width / width, max_height / height)
-                new_width = int(width * ratio)
-                new_height = int(height * ratio)
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                print(f"Resized image to: {new_width}x{new_height}")
-            
-            # Create a copy to work with
-            poster = img.copy()
-            draw = ImageDraw.Draw(poster)
-            
-            # Get final image dimensions
-            width, height = poster.size
-            
-            # Load fonts using the new system with Google Fonts integration
-            print("Loading fonts...")
-            
-            # Define font sizes based on image height (reduced for better fit)
-            title_size = int(height * 0.10)
-            round_size = int(height * 0.14)
-            vs_size = int(height * 0.09)
-            time_size = int(height * 0.07)
-            tiny_size = int(height * 0.05)
-            
-            # Load fonts with Google Fonts fallback
-            try:
-                # Try Google Fonts first, then fallback to local/system fonts
-                font_title = get_font_with_fallbacks("Orbitron", title_size, "bold")  # Modern display font
-                font_round = get_font_with_fallbacks("Orbitron", round_size, "bold")  # Same for round
-                # Use a unique bundled font for player names so styling is consistent regardless of Discord nickname styling
-                font_vs = get_font_with_fallbacks("Capture it", vs_size, "bold")       # Unique display font from Fonts/capture_it
-                font_time = get_font_with_fallbacks("Share Tech Mono", time_size)     # Monospace for time
-                font_tiny = get_font_with_fallbacks("Roboto", tiny_size)              # Small text
-                
-                print("Fonts loaded successfully")
-                
-            except Exception as font_error:
-                print(f"Font loading error: {font_error}")
-                # Ultimate fallback to default fonts
-                font_title = ImageFont.load_default()
-                font_round = ImageFont.load_default()
-                font_vs = ImageFont.load_default()
-                font_time = ImageFont.load_default()
-                font_tiny = ImageFont.load_default()
-            
-            # Define colors for clean visibility
-            text_color = (255, 255, 255)  # Bright white
-            outline_color = (0, 0, 0)     # Pure black
-            yellow_color = (255, 255, 0)  # Bright yellow for important text
-            
-            # Helper function to draw text with outline
-            def draw_text_with_outline(text, x, y, font, text_color=text_color, use_yellow=False):
-                x, y = int(x), int(y)
-                final_text_color = yellow_color if use_yellow else text_color
-                
-                # Draw thick black outline for visibility
-                outline_width = 4
-                for dx in range(-outline_width, outline_width + 1):
-                    for dy in range(-outline_width, outline_width + 1):
-                        if dx != 0 or dy != 0:
-                            try:
-                                draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
-                            except Exception as e:
-                                print(f"Error drawing outline: {e}")
-                
-                # Draw main text on top
-                try:
-                    draw.text((x, y), text, font=font, fill=final_text_color)
-                except Exception as e:
-                    print(f"Error drawing main text: {e}")
-            
-            # Add server name text (top center)
-            try:
-                server_text = server_name
-                server_bbox = draw.textbbox((0, 0), server_text, font=font_title)
-                server_width = server_bbox[2] - server_bbox[0]
-                server_x = (width - server_width) // 2
-                server_y = int(height * 0.08)
-                draw_text_with_outline(server_text, server_x, server_y, font_title)
-                print(f"Added server name: {server_text}")
-            except Exception as e:
-                print(f"Error adding server name: {e}")
-            
-            # Add Round text (center) - use yellow for emphasis
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        prefix = _template_raw_prefix(template_path)
+        width, height = img.size
+        raw_path = TEMPLATE_CACHE_DIR / f"{prefix}_{mtime_ns}_{width}x{height}.rgba"
+        # Per-process temp name: render workers warm the same cold cache concurrently
+        tmp_path = raw_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(img.tobytes())
+        os.replace(tmp_path, raw_path)
+        for stale in TEMPLATE_CACHE_DIR.glob(f"{prefix}_*.rgba"):
+            if stale != raw_path:
+                stale.unlink(missing_ok=True)
+    except Exception as e:
+        print(f"Error persisting template cache for {template_path}: {e}")
+
+def load_template_image(template_path: str) -> Optional["Image.Image"]:
+    """Return a template decoded and downscaled to poster size, using the memory and disk caches.
+
+    The returned image is shared between renders and must not be modified; copy it first.
+    """
+    try:
+        mtime_ns = os.stat(template_path).st_mtime_ns
+    except OSError:
+        print(f"Template file not found: {template_path}")
+        return None
+
+    with _template_cache_lock:
+        cached = _template_images.get(template_path)
+        if cached and cached[0] == mtime_ns:
+            _template_images.move_to_end(template_path)
+            return cached[1]
+
+        img = None
+        prefix = _template_raw_prefix(template_path)
+        for raw_path in TEMPLATE_CACHE_DIR.glob(f"{prefix}_{mtime_ns}_*.rgba"):
             try:
-                round_text = f"ROUND {round_num}"
-                round_bbox = draw.textbbox((0, 0), round_text, font=font_round)
-                round_width = round_bbox[2] - round_bbox[0]
-                round_x = (width - round_width) // 2
-                round_y = int(height * 0.35)
-                draw_text_with_outline(round_text, round_x, round_y, font_round, use_yellow=True)
-                print(f"Added round text: {round_text}")
+                width, height = map(int, raw_path.stem.rsplit('_', 1)[1].split('x'))
+                img = _load_template_raw(raw_path, (width, height))
+                break
             except Exception as e:
-                print(f"Error adding round text: {e}")
-            
-            # Add Captain vs Captain text (center)
-            try:
-                left_name_text = sanitize_username_for_poster(team1_captain)
-                vs_core = " VS "
-                right_name_text = sanitize_username_for_poster(team2_captain)
-
-                # Measure text components to center the whole line
-                left_box = draw.textbbox((0, 0), left_name_text, font=font_vs)
-                vs_box = draw.textbbox((0, 0), vs_core, font=font_vs)
-                right_box = draw.textbbox((0, 0), right_name_text, font=font_vs)
-                
-                total_width = (left_box[2] - left_box[0]) + (vs_box[2] - vs_box[0]) + (right_box[2] - right_box[0])
-                current_x = (width - total_width) // 2
-                vs_y = int(height * 0.55)
+                print(f"Discarding unreadable template cache {raw_path}: {e}")
+                raw_path.unlink(missing_ok=True)
 
-                # Draw left name
-                draw_text_with_outline(left_name_text, current_x, vs_y, font_vs)
-                current_x += (left_box[2] - left_box[0])
-                
-                # Draw VS
-                draw_text_with_outline(vs_core, current_x, vs_y, font_vs, use_yellow=False)
-                current_x += (vs_box[2] - vs_box[0])
-                
-                # Draw right name
-                draw_text_with_outline(right_name_text, current_x, vs_y, font_vs)
-                
-                print(f"Added VS text: {left_name_text} VS {right_name_text}")
-            except Exception as e:
-                print(f"Error adding VS text: {e}")
-            
-            # Add date (if provided)
-            if date_str:
-                try:
-                    date_text = f"DATE:  {date_str}"
-                    date_bbox = draw.textbbox((0, 0), date_text, font=font_time)
-                    date_width = date_bbox[2] - date_bbox[0]
-                    date_x = (width - date_width) // 2
-                    date_y = int(height * 0.72)
-                    draw_text_with_outline(date_text, date_x, date_y, font_time)
-                    print(f"Added date: {date_text}")
-                except Exception as e:
-                    print(f"Error adding date: {e}")
-            
-            # Add UTC time
+        if img is None:
             try:
-                time_text = f"TIME:  {utc_time}"
-                time_bbox = draw.textbbox((0, 0), time_text, font=font_time)
-                time_width = time_bbox[2] - time_bbox[0]
-                time_x = (width - time_width) // 2
-                time_y = int(height * 0.82) if date_str else int(height * 0.75)
-                draw_text_with_outline(time_text, time_x, time_y, font_time)
-                print(f"Added time: {time_text}")
+                img = _decode_template(template_path)
             except Exception as e:
-                print(f"Error adding time: {e}")
-            
-            # Save the modified image
-            output_path = f"temp_poster_{int(datetime.datetime.now().timestamp())}.png"
-            poster.save(output_path, "PNG")
-            print(f"Poster saved successfully: {output_path}")
-            return output_path
+                print(f"Error decoding template {template_path}: {e}")
+                return None
+            _store_template_raw(template_path, mtime_ns, img)
+
+        _template_images[template_path] = (mtime_ns, img)
+        _template_images.move_to_end(template_path)
+        while len(_template_images) > TEMPLATE_MEMORY_CACHE_SIZE:
+            _template_images.popitem(last=False)
+        return img
+
+def get_random_template(seed: Optional[str] = None):
+    """Get a random template image from the Templates folder.
+
+    With a seed the choice is deterministic, so recreating the same match reuses its poster.
+    """
+    image_files = list_templates()
+    if image_files:
+        if seed is not None:
+            return random.Random(seed).choice(image_files)
+        return random.choice(image_files)
+    return None
+
+# ===========================================================================================
+# TEXT LAYER COMPOSITOR
+# ===========================================================================================
+
+# Maximum number of rendered outlined text layers kept in memory
+TEXT_LAYER_CACHE_SIZE = int(os.environ.get("TEXT_LAYER_CACHE_SIZE", "256"))
+
+# Rendered layers keyed by (text, font path, font size, fill, outline color, outline width)
+_text_layer_cache = collections.OrderedDict()
+_text_layer_lock = threading.Lock()
+
+def render_outlined_text(text: str, font, fill: tuple, outline_color: tuple, outline_width: int, anchor: str = "la") -> tuple:
+    """Rasterize text once and build its outline with a square dilation of the glyph mask.
+
+    Matches stamping the text at every offset in a (2w+1)x(2w+1) grid, but costs a single
+    rasterization. Returns (layer, (offset_x, offset_y)) where the offset is relative to the
+    position the text would be drawn at with ImageDraw.text.
+    """
+    key = (text, getattr(font, 'path', id(font)), getattr(font, 'size', None), fill, outline_color, outline_width, anchor)
+    with _text_layer_lock:
+        cached = _text_layer_cache.get(key)
+        if cached is not None:
+            _text_layer_cache.move_to_end(key)
+            return cached
+
+    left, top, right, bottom = font.getbbox(text, anchor=anchor)
+    size = (max(1, right - left + 2 * outline_width), max(1, bottom - top + 2 * outline_width))
+
+    # Glyph coverage mask, padded so the dilation has room to grow
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).text((outline_width - left, outline_width - top), text, font=font, fill=255, anchor=anchor)
+    outline_mask = mask.filter(ImageFilter.MaxFilter(2 * outline_width + 1)) if outline_width > 0 else mask
+
+    outline_layer = Image.new('RGBA', size, tuple(outline_color[:3]) + (0,))
+    outline_layer.putalpha(outline_mask)
+    fill_layer = Image.new('RGBA', size, tuple(fill[:3]) + (0,))
+    fill_layer.putalpha(mask)
+    layer = Image.alpha_composite(outline_layer, fill_layer)
+
+    result = (layer, (left - outline_width, top - outline_width))
+    with _text_layer_lock:
+        _text_layer_cache[key] = result
+        while len(_text_layer_cache) > TEXT_LAYER_CACHE_SIZE:
+            _text_layer_cache.popitem(last=False)
+    return result
+
+def draw_outlined_text(image: "Image.Image", position: tuple, text: str, font, fill: tuple, outline_color: tuple, outline_width: int = 4, anchor: str = "la"):
+    """Composite outlined text onto an RGBA image at the position ImageDraw.text would use"""
+    layer, (offset_x, offset_y) = render_outlined_text(text, font, fill, outline_color, outline_width, anchor)
+    x = int(position[0]) + offset_x
+    y = int(position[1]) + offset_y
+
+    # Clip layers that start off the top/left edge (alpha_composite needs a non-negative destination)
+    source_x, source_y = max(0, -x), max(0, -y)
+    if source_x >= layer.width or source_y >= layer.height:
+        return
+    image.alpha_composite(layer, (max(0, x), max(0, y)), (source_x, source_y))
+
+# Maximum poster dimensions (keeps uploads under Discord size limits)
+POSTER_MAX_SIZE = (800, 600)
+
+def get_poster_size(template_size: tuple) -> tuple:
+    """Return the poster dimensions for a template, downscaled to fit POSTER_MAX_SIZE with aspect ratio kept"""
+    max_width, max_height = POSTER_MAX_SIZE
+    width, height = template_size
+    if width > max_width or height > max_height:
+        ratio = min(max_width / width, max_height / height)
+        return int(width * ratio), int(height * ratio)
+    return width, height
+
+# ===========================================================================================
+# POSTER ENCODER
+# ===========================================================================================
+
+# Candidate output formats in order of preference: png, png8 (palette-quantized), webp, jpeg
+POSTER_FORMATS = [fmt.strip().lower() for fmt in os.environ.get("POSTER_FORMATS", "png,webp,jpeg").split(",") if fmt.strip()]
+
+# Largest encoded poster accepted before falling back to the next format (0 = no budget, first format wins)
+POSTER_BYTE_BUDGET_KB = int(os.environ.get("POSTER_BYTE_BUDGET_KB", "500"))
+
+# Quality for lossy formats (webp/jpeg)
+POSTER_QUALITY = int(os.environ.get("POSTER_QUALITY", "85"))
+
+# zlib level for png/png8 (1 = fastest, 9 = smallest)
+POSTER_PNG_COMPRESS_LEVEL = int(os.environ.get("POSTER_PNG_COMPRESS_LEVEL", "6"))
+
+def _encode_image(image: "Image.Image", fmt: str, quality: int = None) -> bytes:
+    """Encode an image in one poster format"""
+    quality = quality or POSTER_QUALITY
+    buffer = io.BytesIO()
+    if fmt == "png":
+        image.save(buffer, "PNG", compress_level=POSTER_PNG_COMPRESS_LEVEL)
+    elif fmt == "png8":
+        palette = image.convert("RGB").quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        palette.save(buffer, "PNG", compress_level=POSTER_PNG_COMPRESS_LEVEL)
+    elif fmt == "webp":
+        image.convert("RGB").save(buffer, "WEBP", quality=quality, method=4)
+    elif fmt == "jpeg":
+        image.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True)
+    else:
+        raise ValueError(f"Unknown poster format: {fmt}")
+    return buffer.getvalue()
+
+LOSSY_FORMATS = ("webp", "jpeg")
+
+def encode_poster(image: "Image.Image", formats: list = None, byte_budget: int = None, quality: int = None) -> tuple:
+    """Encode a poster with the first format that fits the byte budget.
+
+    With a budget, lossy formats are tried before lossless ones (a full-size PNG rarely fits
+    and costs the most to encode); without one (0) the first format is used. Falls back to the
+    smallest encoding if none fit. quality overrides POSTER_QUALITY for webp/jpeg.
+    Returns (bytes, info) where info records the chosen format, its size, and the size and
+    encode time of every attempt.
+    """
+    formats = formats or POSTER_FORMATS or ["png"]
+    byte_budget = byte_budget if byte_budget is not None else POSTER_BYTE_BUDGET_KB * 1024
+    if byte_budget > 0:
+        # Stable sort keeps the configured order within lossy and within lossless formats
+        formats = sorted(formats, key=lambda fmt: fmt not in LOSSY_FORMATS)
+    attempts = []
+    best = None
+    for fmt in formats:
+        start = perf_counter()
+        try:
+            data = _encode_image(image, fmt, quality)
+        except Exception as e:
+            print(f"Error encoding poster as {fmt}: {e}")
+            continue
+        attempts.append({'format': fmt, 'bytes': len(data), 'ms': round((perf_counter() - start) * 1000, 2)})
+        if best is None or len(data) < len(best[1]):
+            best = (fmt, data)
+        if byte_budget <= 0 or len(data) <= byte_budget:
+            best = (fmt, data)
+            break
+
+    if best is None:
+        # Every configured format failed; plain PNG always works
+        best = ("png", _encode_image(image, "png"))
+
+    info = {
+        'format': best[0],
+        'bytes': len(best[1]),
+        'encode_ms': round(sum(attempt['ms'] for attempt in attempts), 2),
+        'attempts': attempts
+    }
+    return best[1], info
+
+def format_encode_info(info: dict) -> str:
+    """One-line summary of an encode_poster result for logs"""
+    if info.get('cached'):
+        return f"{info['format']} {info['bytes']} bytes (poster cache)"
+    attempts = ", ".join(f"{a['format']}={a['bytes'] // 1024}KB/{a['ms']}ms" for a in info['attempts'])
+    return f"{info['format']} {info['bytes']} bytes in {info['encode_ms']}ms ({attempts})"
+
+def poster_file_extension(data: bytes) -> str:
+    """File extension for encoded poster bytes, detected from the file signature"""
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if data[:3] == b"\xff\xd8\xff":
+        return "jpg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return "png"
+
+# ===========================================================================================
+# POSTER CACHE SYSTEM
+# ===========================================================================================
+
+# Bump when poster rendering changes so stale cached posters are not served
+POSTER_CACHE_VERSION = 4
+
+# Rendered posters keyed by a hash of their inputs
+POSTER_CACHE_DIR = CACHE_DIR / "posters"
+POSTER_CACHE_DISK_MB = int(os.environ.get("POSTER_CACHE_DISK_MB", "100"))
+POSTER_CACHE_MEMORY_MB = int(os.environ.get("POSTER_CACHE_MEMORY_MB", "16"))
+
+class PosterCache:
+    """
+    Size-bounded LRU cache of rendered posters, in memory and on disk.
+    
+    Entries are keyed by poster_cache_key() so identical render requests (same template,
+    round, captains, time, date and tournament) return the stored bytes without rendering.
+    Disk entries are shared between the bot and its render workers; the least recently
+    used files (by mtime) are evicted once the directory exceeds its byte budget.
+    """
+    
+    def __init__(self, cache_dir: Path, max_disk_bytes: int, max_memory_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self._memory = collections.OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.poster"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached poster bytes, or None on a miss"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+        
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used for disk eviction
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        self._remember(key, data)
+        return data
+    
+    def put(self, key: str, data: bytes, persist: bool = True):
+        """Store poster bytes in memory and, if persist is set, on disk"""
+        self._remember(key, data)
+        if not persist or self.max_disk_bytes <= 0:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._evict_disk()
+        except Exception as e:
+            print(f"Error writing poster cache entry {key}: {e}")
+    
+    def _remember(self, key: str, data: bytes):
+        if len(data) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+    
+    def _evict_disk(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".poster"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_disk_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def stats(self) -> dict:
+        """Hit/miss counters and memory usage for this process"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes
+            }
+
+poster_cache = PosterCache(POSTER_CACHE_DIR, POSTER_CACHE_DISK_MB * 1024 * 1024, POSTER_CACHE_MEMORY_MB * 1024 * 1024)
+
+def poster_cache_key(template_path: str, round_num: int, team1_captain: str, team2_captain: str, utc_time: str, date_str: str = None, tournament_name: str = "ICF Tournament", server_name: str = "ICF Tournament Bot") -> str:
+    """Hash the inputs that determine a poster. Takes the same arguments as create_event_poster."""
+    try:
+        template_mtime = os.stat(template_path).st_mtime_ns
+    except OSError:
+        template_mtime = None
+    key_parts = [
+        POSTER_CACHE_VERSION,
+        os.path.abspath(template_path),
+        template_mtime,
+        str(round_num),
+        sanitize_username_for_poster(team1_captain),
+        sanitize_username_for_poster(team2_captain),
+        utc_time,
+        date_str,
+        tournament_name,
+        server_name,
+        POSTER_FORMATS,
+        POSTER_BYTE_BUDGET_KB,
+        POSTER_QUALITY
+    ]
+    return hashlib.sha256(json.dumps(key_parts).encode('utf-8')).hexdigest()
+
+def cached_poster_info(poster_bytes: bytes) -> dict:
+    """encode_poster-style info for a poster served from the cache"""
+    return {'format': poster_file_extension(poster_bytes), 'bytes': len(poster_bytes), 'encode_ms': 0.0, 'attempts': [], 'cached': True}
+
+def create_event_poster(template_path: str, round_num: int, team1_captain: str, team2_captain: str, utc_time: str, date_str: str = None, tournament_name: str = "ICF Tournament", server_name: str = "ICF Tournament Bot") -> tuple:
+    """Create event poster with text overlays.
+
+    Returns (poster bytes, encode info), or (None, None) on failure.
+    Identical requests are served from the poster cache without rendering.
+    """
+    key = poster_cache_key(template_path, round_num, team1_captain, team2_captain, utc_time, date_str, tournament_name, server_name)
+    cached = poster_cache.get(key)
+    if cached is not None:
+        print(f"Poster cache hit: {key[:12]}")
+        return cached, cached_poster_info(cached)
+    
+    poster_bytes, encode_info = _render_event_poster(template_path, round_num, team1_captain, team2_captain, utc_time, date_str, tournament_name, server_name)
+    if poster_bytes:
+        poster_cache.put(key, poster_bytes)
+    return poster_bytes, encode_info
+
+def draw_poster_overlays(poster: "Image.Image", round_num: int, team1_captain: str, team2_captain: str, utc_time: str, date_str: str = None, server_name: str = "ICF Tournament Bot"):
+    """Draw the outlined poster text (server name, round, captains, date, time) onto an RGBA poster"""
+    draw = ImageDraw.Draw(poster)
+    
+    # Get final image dimensions
+    width, height = poster.size
+    
+    # Load fonts using the new system with Google Fonts integration
+    print("Loading fonts...")
+    
+    # Load fonts with Google Fonts fallback
+    try:
+        font_title, font_round, font_vs, font_time, font_tiny = load_poster_fonts(height)
+        
+        print("Fonts loaded successfully")
+        
+    except Exception as font_error:
+        print(f"Font loading error: {font_error}")
+        # Ultimate fallback to default fonts
+        font_title = ImageFont.load_default()
+        font_round = ImageFont.load_default()
+        font_vs = ImageFont.load_default()
+        font_time = ImageFont.load_default()
+        font_tiny = ImageFont.load_default()
+    
+    # Define colors for clean visibility
+    text_color = (255, 255, 255)  # Bright white
+    outline_color = (0, 0, 0)     # Pure black
+    yellow_color = (255, 255, 0)  # Bright yellow for important text
+    
+    # Helper function to draw text with outline (composited from the cached text layers)
+    def draw_text_with_outline(text, x, y, font, text_color=text_color, use_yellow=False):
+        final_text_color = yellow_color if use_yellow else text_color
+        try:
+            draw_outlined_text(poster, (x, y), text, font, final_text_color, outline_color, outline_width=4)
+        except Exception as e:
+            print(f"Error drawing text with outline: {e}")
+    
+    # Add server name text (top center)
+    try:
+        server_text = server_name
+        server_bbox = draw.textbbox((0, 0), server_text, font=font_title)
+        server_width = server_bbox[2] - server_bbox[0]
+        server_x = (width - server_width) // 2
+        server_y = int(height * 0.08)
+        draw_text_with_outline(server_text, server_x, server_y, font_title)
+        print(f"Added server name: {server_text}")
+    except Exception as e:
+        print(f"Error adding server name: {e}")
+    
+    # Add Round text (center) - use yellow for emphasis
+    try:
+        round_text = f"ROUND {round_num}"
+        round_bbox = draw.textbbox((0, 0), round_text, font=font_round)
+        round_width = round_bbox[2] - round_bbox[0]
+        round_x = (width - round_width) // 2
+        round_y = int(height * 0.35)
+        draw_text_with_outline(round_text, round_x, round_y, font_round, use_yellow=True)
+        print(f"Added round text: {round_text}")
+    except Exception as e:
+        print(f"Error adding round text: {e}")
+    
+    # Add Captain vs Captain text (center)
+    try:
+        left_name_text = sanitize_username_for_poster(team1_captain)
+        vs_core = " VS "
+        right_name_text = sanitize_username_for_poster(team2_captain)
+        
+        # Split names into runs so characters the poster font lacks use a fallback font
+        font_chain = get_fallback_font_chain(getattr(font_vs, 'path', None))
+        left_runs = segment_text_runs(left_name_text, font_chain) or (("Player", None),)
+        right_runs = segment_text_runs(right_name_text, font_chain) or (("Player", None),)
+        
+        def measure_runs(runs):
+            """Return [(text, font, advance)] for a name's runs"""
+            measured = []
+            for run_text, run_path in runs:
+                run_font = font_vs if run_path in (None, getattr(font_vs, 'path', None)) else load_truetype_cached(run_path, font_vs.size)
+                if len(runs) == 1:
+                    run_box = draw.textbbox((0, 0), run_text, font=run_font)
+                    advance = run_box[2] - run_box[0]
+                else:
+                    advance = run_font.getlength(run_text)
+                measured.append((run_text, run_font, advance))
+            return measured
+        
+        def draw_runs(measured, x, y):
+            """Draw measured runs from x and return the x after the last run"""
+            if len(measured) == 1:
+                run_text, run_font, advance = measured[0]
+                draw_text_with_outline(run_text, x, y, run_font)
+                return x + advance
+            # Mixed fonts share the poster font's baseline
+            baseline = y + font_vs.getmetrics()[0]
+            for run_text, run_font, advance in measured:
+                draw_outlined_text(poster, (x, baseline), run_text, run_font, text_color, outline_color, outline_width=4, anchor="ls")
+                x += advance
+            return x
+        
+        # Measure text components to center the whole line
+        left_measured = measure_runs(left_runs)
+        vs_box = draw.textbbox((0, 0), vs_core, font=font_vs)
+        right_measured = measure_runs(right_runs)
+        
+        total_width = sum(run[2] for run in left_measured) + (vs_box[2] - vs_box[0]) + sum(run[2] for run in right_measured)
+        current_x = (width - total_width) // 2
+        vs_y = int(height * 0.55)
+    
+        # Draw left name
+        current_x = draw_runs(left_measured, current_x, vs_y)
+        
+        # Draw VS
+        draw_text_with_outline(vs_core, current_x, vs_y, font_vs, use_yellow=False)
+        current_x += (vs_box[2] - vs_box[0])
+        
+        # Draw right name
+        draw_runs(right_measured, current_x, vs_y)
+        
+        print(f"Added VS text: {left_name_text} VS {right_name_text}")
+    except Exception as e:
+        print(f"Error adding VS text: {e}")
+    
+    # Add date (if provided)
+    if date_str:
+        try:
+            date_text = f"DATE:  {date_str}"
+            date_bbox = draw.textbbox((0, 0), date_text, font=font_time)
+            date_width = date_bbox[2] - date_bbox[0]
+            date_x = (width - date_width) // 2
+            date_y = int(height * 0.72)
+            draw_text_with_outline(date_text, date_x, date_y, font_time)
+            print(f"Added date: {date_text}")
+        except Exception as e:
+            print(f"Error adding date: {e}")
+    
+    # Add UTC time
+    try:
+        time_text = f"TIME:  {utc_time}"
+        time_bbox = draw.textbbox((0, 0), time_text, font=font_time)
+        time_width = time_bbox[2] - time_bbox[0]
+        time_x = (width - time_width) // 2
+        time_y = int(height * 0.82) if date_str else int(height * 0.75)
+        draw_text_with_outline(time_text, time_x, time_y, font_time)
+        print(f"Added time: {time_text}")
+    except Exception as e:
+        print(f"Error adding time: {e}")
+
+def _render_event_poster(template_path: str, round_num: int, team1_captain: str, team2_captain: str, utc_time: str, date_str: str = None, tournament_name: str = "ICF Tournament", server_name: str = "ICF Tournament Bot") -> tuple:
+    """Render an event poster with text overlays and return (encoded poster bytes, encode info)"""
+    print(f"Creating poster with template: {template_path}")
+    
+    try:
+        # Validate template path
+        if not os.path.exists(template_path):
+            print(f"Template file not found: {template_path}")
+            return None, None
             
+        # Load the template pre-decoded and pre-scaled from the template cache
+        img = load_template_image(template_path)
+        if img is None:
+            return None, None
+        
+        # Create a copy to work with (the cached template is shared)
+        poster = img.copy()
+        
+        # Draw server name, round, captains, date and time
+        draw_poster_overlays(poster, round_num, team1_captain, team2_captain, utc_time, date_str, server_name)
+        
+        # Encode the poster in memory under the upload byte budget; nothing is written to disk
+        return encode_poster(poster)
+        
+    except Exception as e:
+        print(f"Critical error creating poster: {e}")
+        import traceback
+        traceback.print_exc()
+        return None, None
+
+# ===========================================================================================
+# POSTER RENDERING EXECUTOR
+# ===========================================================================================
+
+# Number of worker processes for poster rendering (0 renders in a thread instead)
+POSTER_RENDER_WORKERS = int(os.environ.get("POSTER_RENDER_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Maximum renders waiting for a worker before new requests are rejected
+POSTER_RENDER_QUEUE_DEPTH = int(os.environ.get("POSTER_RENDER_QUEUE_DEPTH", "16"))
+
+_render_executor = None
+_render_pending = 0
+
+def preload_poster_assets():
+    """Load every template and the poster fonts for its size so the first render in this process is warm"""
+    try:
+        heights = set()
+        for template_path in list_templates():
+            img = load_template_image(template_path)
+            if img is not None:
+                heights.add(img.size[1])
+        for height in heights:
+            fonts = load_poster_fonts(height)
+        if heights:
+            # Coverage indexes for the captain-name fallback chain
+            preload_font_coverage(getattr(fonts[2], 'path', None))
+    except Exception as e:
+        print(f"Error preloading poster assets: {e}")
+
+def _init_render_worker():
+    """Process pool initializer: warm fonts and templates in each worker"""
+    preload_poster_assets()
+
+def _render_worker_ping() -> int:
+    """No-op task used to force worker processes to start"""
+    return os.getpid()
+
+def get_render_executor() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared poster rendering process pool, creating it on first use"""
+    global _render_executor
+    if _render_executor is None and POSTER_RENDER_WORKERS > 0:
+        _render_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=POSTER_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker
+        )
+        print(f"Poster render pool started with {POSTER_RENDER_WORKERS} worker(s)")
+    return _render_executor
+
+async def warm_render_executor():
+    """Start every render worker up front so the first poster doesn't pay process startup"""
+    executor = get_render_executor()
+    if executor is None:
+        await asyncio.to_thread(preload_poster_assets)
+        return
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.gather(*[loop.run_in_executor(executor, _render_worker_ping) for _ in range(POSTER_RENDER_WORKERS)])
+        print("Poster render workers warmed up")
+    except Exception as e:
+        print(f"Error warming poster render workers: {e}")
+
+def shutdown_render_executor():
+    """Stop the poster rendering process pool"""
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+async def render_event_poster(*args, **kwargs) -> tuple:
+    """Render an event poster off the event loop. Takes the same arguments as create_event_poster.
+
+    Returns (poster bytes, encode info), or (None, None) if the render queue is full or rendering fails.
+    """
+    global _render_pending, _render_executor
+    
+    # Serve repeated requests from the poster cache without touching the render pool
+    key = poster_cache_key(*args, **kwargs)
+    cached = await asyncio.to_thread(poster_cache.get, key)
+    if cached is not None:
+        print(f"Poster cache hit: {key[:12]}")
+        return cached, cached_poster_info(cached)
+    
+    if _render_pending >= POSTER_RENDER_WORKERS + POSTER_RENDER_QUEUE_DEPTH:
+        print(f"Poster render queue full ({_render_pending} pending), skipping poster")
+        return None, None
+
+    _render_pending += 1
+    try:
+        executor = get_render_executor()
+        if executor is None:
+            return await asyncio.to_thread(functools.partial(create_event_poster, *args, **kwargs))
+        loop = asyncio.get_running_loop()
+        poster_bytes, encode_info = await loop.run_in_executor(executor, functools.partial(create_event_poster, *args, **kwargs))
+        if poster_bytes:
+            # The worker already wrote the disk entry; keep a copy in this process's memory
+            poster_cache.put(key, poster_bytes, persist=False)
+        return poster_bytes, encode_info
+    except concurrent.futures.process.BrokenProcessPool as e:
+        # A worker died; drop the pool so the next render starts a fresh one
+        print(f"Poster render pool broken, restarting on next render: {e}")
+        _render_executor = None
+        return None, None
+    except Exception as e:
+        print(f"Error rendering poster: {e}")
+        return None, None
+    finally:
+        _render_pending -= 1
+
+# Optional directory to archive rendered posters to (disabled when unset)
+POSTER_ARCHIVE_DIR = os.environ.get("POSTER_ARCHIVE_DIR", "")
+
+def archive_poster(event_id: str, poster_bytes: bytes) -> Optional[str]:
+    """Write a rendered poster to POSTER_ARCHIVE_DIR if archiving is enabled. Returns the file path."""
+    if not POSTER_ARCHIVE_DIR:
+        return None
+    try:
+        os.makedirs(POSTER_ARCHIVE_DIR, exist_ok=True)
+        # Content hash keeps names unique even for events created in the same second
+        digest = hashlib.sha256(poster_bytes).hexdigest()[:12]
+        archive_path = os.path.join(POSTER_ARCHIVE_DIR, f"{event_id}_{digest}.{poster_file_extension(poster_bytes)}")
+        with open(archive_path, 'wb') as f:
+            f.write(poster_bytes)
+        return archive_path
+    except Exception as e:
+        print(f"Error archiving poster for {event_id}: {e}")
+        return None
+
+def calculate_time_difference(event_datetime: datetime.datetime, user_timezone: str = None) -> dict:
+    """Calculate time difference and format for different timezones"""
+    current_time = datetime.datetime.now()
+    time_diff = event_datetime - current_time
+    minutes_remaining = int(time_diff.total_seconds() / 60)
+    
+    # Format UTC time exactly as requested
+    utc_time_str = event_datetime.strftime("%H:%M utc, %d/%m")
+    
+    # Try to detect user's local timezone
+    local_timezone = None
+    if user_timezone:
+        try:
+            local_timezone = pytz.timezone(user_timezone)
+        except:
+            pass
+    
+    # If no user timezone provided, try to detect from system
+    if not local_timezone:
+        try:
+            # Try to get system timezone
+            import time
+            local_timezone = pytz.timezone(time.tzname[time.daylight])
+        except:
+            # Fallback to IST if detection fails
+            local_timezone = pytz.timezone('Asia/Kolkata')
+    
+    # Calculate user's local time
+    local_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(local_timezone)
+    local_time_formatted = local_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    # Calculate other common timezones
+    ist_tz = pytz.timezone('Asia/Kolkata')
+    ist_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(ist_tz)
+    ist_formatted = ist_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    est_tz = pytz.timezone('America/New_York')
+    est_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(est_tz)
+    est_formatted = est_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    gmt_tz = pytz.timezone('Europe/London')
+    gmt_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(gmt_tz)
+    gmt_formatted = gmt_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    return {
+        'minutes_remaining': minutes_remaining,
+        'utc_time': utc_time_str,
+        'utc_time_simple': event_datetime.strftime("%H:%M UTC"),
+        'local_time': local_time_formatted,
+        'ist_time': ist_formatted,
+        'est_time': est_formatted,
+        'gmt_time': gmt_formatted
+    }
+
+def has_event_create_permission(interaction):
+    """Check if user has permission to create events (Organizers, Helpers Tournament, or Bot Owner)"""
+    # Bot owner has access to all commands
+    if interaction.user.id == BOT_OWNER_ID:
+        return True
+    
+    organizers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizers"])
+    helpers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["helpers_tournament"])
+    return organizers_role is not None or helpers_role is not None
+
+def has_event_result_permission(interaction):
+    """Check if user has permission to post event results (Organizers, Helpers Tournament, or Bot Owner)"""
+    # Bot owner has access to all commands
+    if interaction.user.id == BOT_OWNER_ID:
+        return True
+    
+    organizers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizers"])
+    helpers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["helpers_tournament"])
+    return organizers_role is not None or helpers_role is not None
+
+# ===========================================================================================
+# SCREENSHOT PIPELINE
+# ===========================================================================================
+
+# Threads downscaling and recompressing result screenshots (Pillow releases the GIL while decoding and encoding)
+SCREENSHOT_WORKERS = max(1, int(os.environ.get("SCREENSHOT_WORKERS", str(min(4, os.cpu_count() or 1)))))
+
+# Longest side of a posted screenshot; larger screenshots are downscaled with aspect ratio kept
+SCREENSHOT_MAX_DIMENSION = int(os.environ.get("SCREENSHOT_MAX_DIMENSION", "1600"))
+
+# Formats tried in order for recompressed screenshots (same names as POSTER_FORMATS)
+SCREENSHOT_FORMATS = [fmt.strip().lower() for fmt in os.environ.get("SCREENSHOT_FORMATS", "webp,jpeg").split(",") if fmt.strip()]
+
+# Largest recompressed screenshot accepted before lowering quality
+SCREENSHOT_BYTE_BUDGET_KB = int(os.environ.get("SCREENSHOT_BYTE_BUDGET_KB", "300"))
+
+# Starting quality for recompressed screenshots; lowered in steps down to 40 until the budget fits
+SCREENSHOT_QUALITY = int(os.environ.get("SCREENSHOT_QUALITY", "80"))
+
+SCREENSHOT_QUALITY_STEP = 15
+SCREENSHOT_MIN_QUALITY = 40
+
+_screenshot_executor = None
+
+def get_screenshot_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared screenshot pipeline thread pool, creating it on first use"""
+    global _screenshot_executor
+    if _screenshot_executor is None:
+        _screenshot_executor = concurrent.futures.ThreadPoolExecutor(max_workers=SCREENSHOT_WORKERS, thread_name_prefix="screenshot")
+    return _screenshot_executor
+
+def shutdown_screenshot_executor():
+    """Stop the screenshot pipeline thread pool"""
+    global _screenshot_executor
+    if _screenshot_executor is not None:
+        _screenshot_executor.shutdown(wait=False, cancel_futures=True)
+        _screenshot_executor = None
+
+def recompress_screenshot(fp) -> tuple:
+    """
+    Downscale a screenshot to SCREENSHOT_MAX_DIMENSION and re-encode it under the byte budget.
+    
+    Re-encoding drops EXIF, ICC and other metadata (orientation is applied to the pixels first).
+    Returns (bytes, info) as encode_poster does, with the output size added to info.
+    """
+    fp.seek(0)
+    with Image.open(fp) as img:
+        # Let the JPEG decoder scale down by a power of two while decoding
+        img.draft("RGB", (SCREENSHOT_MAX_DIMENSION, SCREENSHOT_MAX_DIMENSION))
+        image = ImageOps.exif_transpose(img).convert("RGB")
+        image.thumbnail((SCREENSHOT_MAX_DIMENSION, SCREENSHOT_MAX_DIMENSION), Image.Resampling.LANCZOS, reducing_gap=3.0)
+    return encode_screenshot(image, SCREENSHOT_BYTE_BUDGET_KB * 1024)
+
+def encode_screenshot(image: "Image.Image", byte_budget: int) -> tuple:
+    """Encode with SCREENSHOT_FORMATS, lowering quality in steps until byte_budget fits"""
+    quality = SCREENSHOT_QUALITY
+    while True:
+        data, info = encode_poster(image, SCREENSHOT_FORMATS or ["jpeg"], byte_budget, quality)
+        if info['bytes'] <= byte_budget or quality <= SCREENSHOT_MIN_QUALITY:
+            break
+        quality = max(SCREENSHOT_MIN_QUALITY, quality - SCREENSHOT_QUALITY_STEP)
+    info['quality'] = quality
+    info['size'] = image.size
+    return data, info
+
+async def optimize_screenshots(screenshots: list):
+    """
+    Recompress downloaded screenshots in the pipeline pool, replacing each entry's buffer and
+    filename in place. Screenshots that can't be decoded (or don't shrink) are posted as uploaded.
+    """
+    if not screenshots:
+        return
+    loop = asyncio.get_running_loop()
+    executor = get_screenshot_executor()
+    started = perf_counter()
+    outcomes = await asyncio.gather(
+        *(loop.run_in_executor(executor, recompress_screenshot, screenshot['fp']) for screenshot in screenshots),
+        return_exceptions=True
+    )
+    
+    original_total = 0
+    optimized_total = 0
+    for screenshot, outcome in zip(screenshots, outcomes):
+        original_size = screenshot['size']
+        original_total += original_size
+        if isinstance(outcome, BaseException):
+            print(f"Could not recompress screenshot {screenshot['label']}, posting the original: {type(outcome).__name__}: {outcome}")
+            optimized_total += original_size
+            continue
+        data, info = outcome
+        if len(data) >= original_size:
+            optimized_total += original_size
+            continue
+        
+        close_screenshots([screenshot])
+        stem = os.path.splitext(screenshot['filename'])[0]
+        screenshot['fp'] = io.BytesIO(data)
+        screenshot['filename'] = f"{stem}.{poster_file_extension(data)}"
+        screenshot['size'] = len(data)
+        optimized_total += len(data)
+        width, height = info['size']
+        print(f"Recompressed screenshot {screenshot['label']}: {format_megabytes(original_size)} -> {len(data) // 1024} KB "
+              f"({info['format']} q{info['quality']} {width}x{height}, {info['encode_ms']}ms encode)")
+    
+    print(f"Screenshots recompressed: {format_megabytes(original_total)} -> {format_megabytes(optimized_total)} "
+          f"for {len(screenshots)} file(s) in {(perf_counter() - started) * 1000:.0f} ms")
+
+# ===========================================================================================
+# SCREENSHOT CONTACT SHEETS
+# ===========================================================================================
+
+# Width of one screenshot tile on a contact sheet (tile height follows the screenshots' typical aspect ratio)
+SCREENSHOT_SHEET_TILE_WIDTH = int(os.environ.get("SCREENSHOT_SHEET_TILE_WIDTH", "640"))
+
+# Most screenshots tiled onto one sheet; more are split evenly across sheets (11 -> 6 + 5)
+SCREENSHOT_SHEET_MAX_TILES = max(1, int(os.environ.get("SCREENSHOT_SHEET_MAX_TILES", "6")))
+
+SCREENSHOT_SHEET_COLUMNS = 3
+SCREENSHOT_SHEET_GAP = 8
+SCREENSHOT_SHEET_BACKGROUND = (24, 26, 32)
+
+# A sheet may use the byte budget of this many single screenshots
+SCREENSHOT_SHEET_BUDGET_FACTOR = 3
+
+def screenshot_dimensions(fp) -> tuple:
+    """(width, height) from the image header without decoding pixels"""
+    fp.seek(0)
+    with Image.open(fp) as img:
+        width, height = img.size
+        # EXIF orientations 5-8 rotate by 90 degrees
+        if img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            return height, width
+        return width, height
+
+def sheet_tile_size(dimensions: list) -> tuple:
+    """Tile (width, height) shaped like the median screenshot, clamped between 2:5 and 5:2"""
+    ratios = sorted(height / width for width, height in dimensions)
+    ratio = min(2.5, max(0.4, ratios[len(ratios) // 2]))
+    return SCREENSHOT_SHEET_TILE_WIDTH, int(SCREENSHOT_SHEET_TILE_WIDTH * ratio)
+
+def load_sheet_tile(fp, tile_size: tuple) -> "Image.Image":
+    """Decode a screenshot at reduced size and fit it inside tile_size"""
+    fp.seek(0)
+    with Image.open(fp) as img:
+        # Let the JPEG decoder scale down by a power of two while decoding
+        img.draft("RGB", tile_size)
+        tile = ImageOps.exif_transpose(img).convert("RGB")
+    tile.thumbnail(tile_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    return tile
+
+def compose_contact_sheet(tiles: list, tile_size: tuple) -> tuple:
+    """
+    Paste (label, tile) pairs onto one grid image with outlined SS-n labels and encode it.
+    
+    Resizing, pasting and label compositing all run inside Pillow's C code, so no Python
+    loops touch individual pixels. Returns (bytes, info) as encode_screenshot does.
+    """
+    tile_width, tile_height = tile_size
+    columns = min(SCREENSHOT_SHEET_COLUMNS, len(tiles))
+    rows = -(-len(tiles) // columns)
+    gap = SCREENSHOT_SHEET_GAP
+    sheet = Image.new("RGBA", (columns * (tile_width + gap) + gap, rows * (tile_height + gap) + gap), SCREENSHOT_SHEET_BACKGROUND + (255,))
+    font = get_font_with_fallbacks("Share Tech Mono", max(14, tile_height // 10))
+    
+    for index, (label, tile) in enumerate(tiles):
+        row, column = divmod(index, columns)
+        x = gap + column * (tile_width + gap)
+        y = gap + row * (tile_height + gap)
+        # Center the tile in its cell (screenshots with another aspect ratio are letterboxed)
+        sheet.paste(tile, (x + (tile_width - tile.width) // 2, y + (tile_height - tile.height) // 2))
+        draw_outlined_text(sheet, (x + gap, y + gap // 2), label, font, (255, 255, 255), (0, 0, 0), outline_width=2)
+    
+    return encode_screenshot(sheet.convert("RGB"), SCREENSHOT_BYTE_BUDGET_KB * 1024 * SCREENSHOT_SHEET_BUDGET_FACTOR)
+
+async def build_contact_sheets(screenshots: list) -> Optional[list]:
+    """
+    Tile screenshots onto one or two labelled contact sheets in the screenshot pool.
+    
+    Returns new screenshot entries (the sheets, followed by any screenshot that isn't an image)
+    and closes the tiled originals, or returns None (closing nothing) if no sheet could be built.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_screenshot_executor()
+    started = perf_counter()
+    
+    dimensions = await asyncio.gather(
+        *(loop.run_in_executor(executor, screenshot_dimensions, screenshot['fp']) for screenshot in screenshots),
+        return_exceptions=True
+    )
+    images = [(screenshot, size) for screenshot, size in zip(screenshots, dimensions) if not isinstance(size, BaseException)]
+    others = [screenshot for screenshot, size in zip(screenshots, dimensions) if isinstance(size, BaseException)]
+    if len(images) < 2:
+        return None
+    
+    tile_size = sheet_tile_size([size for _, size in images])
+    try:
+        tiles = await asyncio.gather(
+            *(loop.run_in_executor(executor, load_sheet_tile, screenshot['fp'], tile_size) for screenshot, _ in images)
+        )
+        # Split evenly so 7 screenshots become 4 + 3 rather than 6 + 1
+        sheet_count = -(-len(tiles) // SCREENSHOT_SHEET_MAX_TILES)
+        per_sheet = -(-len(tiles) // sheet_count)
+        labelled = [(screenshot['label'], tile) for (screenshot, _), tile in zip(images, tiles)]
+        groups = [labelled[i:i + per_sheet] for i in range(0, len(labelled), per_sheet)]
+        encoded = await asyncio.gather(
+            *(loop.run_in_executor(executor, compose_contact_sheet, group, tile_size) for group in groups)
+        )
     except Exception as e:
-        print(f"Critical error creating poster: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"Error building screenshot contact sheet, posting screenshots separately: {type(e).__name__}: {e}")
         return None
+    
+    sheets = []
+    for group, (data, info) in zip(groups, encoded):
+        first, last = group[0][0], group[-1][0]
+        width, height = info['size']
+        print(f"Contact sheet {first}..{last}: {len(group)} screenshot(s), {width}x{height} {info['format']} q{info['quality']}, {len(data) // 1024} KB")
+        sheets.append({
+            'label': f"{first}-{last.split('-')[-1]}",
+            'filename': f"{first}-{last.split('-')[-1]}_contact_sheet.{poster_file_extension(data)}",
+            'fp': io.BytesIO(data),
+            'size': len(data),
+            'ms': 0.0,
+        })
+    print(f"Built {len(sheets)} contact sheet(s) from {len(images)} screenshot(s) in {(perf_counter() - started) * 1000:.0f} ms")
+    close_screenshots([screenshot for screenshot, _ in images])
+    # Screenshots that aren't images are still posted on their own
+    return sheets + others
 
-def calculate_time_difference(event_datetime: datetime.datetime, user_timezone: str = None) -> dict:
-    """Calculate time difference and format for different timezones"""
-    current_time = datetime.datetime.now()
-    time_diff = event_datetime - current_time
-    minutes_remaining = int(time_diff.total_seconds() / 60)
+# ===========================================================================================
+# SCREENSHOT DUPLICATE INDEX
+# ===========================================================================================
+
+# Screenshots whose 64-bit difference hashes differ in at most this many bits are flagged as near-duplicates
+SCREENSHOT_DUPLICATE_DISTANCE = max(0, min(15, int(os.environ.get("SCREENSHOT_DUPLICATE_DISTANCE", "6"))))
+
+DHASH_BITS = 64
+
+def dhash_screenshot(fp) -> int:
+    """64-bit difference hash: brightness gradients of a 9x8 grayscale thumbnail, row by row"""
+    fp.seek(0)
+    with Image.open(fp) as img:
+        img.draft("L", (64, 64))
+        small = ImageOps.exif_transpose(img).convert("L").resize((9, 8), Image.Resampling.BOX)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for column in range(8):
+            left = pixels[row * 9 + column]
+            value = (value << 1) | (left > pixels[row * 9 + column + 1])
+    return value
+
+def fingerprint_screenshot(fp) -> tuple:
+    """(sha256 hex of the bytes, dhash or None if the file isn't an image)"""
+    fp.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: fp.read(SCREENSHOT_CHUNK_BYTES), b""):
+        digest.update(chunk)
+    try:
+        dhash = dhash_screenshot(fp)
+    except Exception:
+        dhash = None
+    return digest.hexdigest(), dhash
+
+if hasattr(int, "bit_count"):
+    def hamming_distance(a: int, b: int) -> int:
+        return (a ^ b).bit_count()
+else:
+    # int.bit_count needs Python 3.10
+    def hamming_distance(a: int, b: int) -> int:
+        return bin(a ^ b).count("1")
+
+class ScreenshotHashIndex:
+    """
+    Multi-index hash table over screenshot dHashes.
     
-    # Format UTC time exactly as requested
-    utc_time_str = event_datetime.strftime("%H:%M utc, %d/%m")
+    The 64 hash bits are split into max_distance + 1 chunks, each with its own lookup table.
+    Two hashes within max_distance bits of each other must agree exactly on at least one
+    chunk (pigeonhole), so a lookup only compares against hashes sharing a chunk instead of
+    every stored hash. Exact byte duplicates are found by sha256.
+    """
     
-    # Try to detect user's local timezone
-    local_timezone = None
-    if user_timezone:
-        try:
-            local_timezone = pytz.timezone(user_timezone)
-        except:
-            pass
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        chunk_count = max_distance + 1
+        bounds = [DHASH_BITS * i // chunk_count for i in range(chunk_count + 1)]
+        # (shift, mask) per chunk
+        self._chunks = [(low, (1 << (high - low)) - 1) for low, high in zip(bounds, bounds[1:])]
+        self._tables = [{} for _ in self._chunks]
+        self._by_hash = {}
+        self._by_sha = {}
+        self._count = 0
     
-    # If no user timezone provided, try to detect from system
-    if not local_timezone:
-        try:
-            # Try to get system timezone
-            import time
-            local_timezone = pytz.timezone(time.tzname[time.daylight])
-        except:
-            # Fallback to IST if detection fails
-            local_timezone = pytz.timezone('Asia/Kolkata')
+    def __len__(self) -> int:
+        return self._count
     
-    # Calculate user's local time
-    local_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(local_timezone)
-    local_time_formatted = local_time.strftime("%A, %d %B, %Y %H:%M")
+    def add(self, record: dict):
+        """Index a stored record (dhash as a hex string, sha256 hex)"""
+        self._count += 1
+        self._by_sha.setdefault(record['sha256'], record)
+        if record.get('dhash') is None:
+            return
+        dhash = int(record['dhash'], 16)
+        if dhash in self._by_hash:
+            self._by_hash[dhash].append(record)
+            return
+        self._by_hash[dhash] = [record]
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            table.setdefault((dhash >> shift) & mask, set()).add(dhash)
     
-    # Calculate other common timezones
-    ist_tz = pytz.timezone('Asia/Kolkata')
-    ist_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(ist_tz)
-    ist_formatted = ist_time.strftime("%A, %d %B, %Y %H:%M")
+    def find_exact(self, sha256: str) -> Optional[dict]:
+        """The first stored screenshot with identical bytes"""
+        return self._by_sha.get(sha256)
     
-    est_tz = pytz.timezone('America/New_York')
-    est_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(est_tz)
-    est_formatted = est_time.strftime("%A, %d %B, %Y %H:%M")
+    def find_similar(self, dhash: int) -> list:
+        """[(distance, record)] within max_distance bits, closest first"""
+        candidates = set()
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            candidates.update(table.get((dhash >> shift) & mask, ()))
+        matches = []
+        for candidate in candidates:
+            distance = hamming_distance(dhash, candidate)
+            if distance <= self.max_distance:
+                matches.extend((distance, record) for record in self._by_hash[candidate])
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+screenshot_index = ScreenshotHashIndex(SCREENSHOT_DUPLICATE_DISTANCE)
+
+async def load_screenshot_index():
+    """Index the fingerprints of screenshots posted in earlier results"""
+    try:
+        start = perf_counter()
+        records = await persistence_writer.run(lambda: get_event_store().load_screenshot_hashes())
+        for record in records:
+            screenshot_index.add(record)
+        print(f"Indexed {len(records)} result screenshot hash(es) in {(perf_counter() - start) * 1000:.1f}ms")
+    except Exception as e:
+        print(f"Error loading screenshot hashes: {e}")
+
+def describe_screenshot_record(record: dict) -> str:
+    """Which earlier result a stored screenshot came from, for judge-facing notes"""
+    when = (record.get('created_at') or "")[:10]
+    match = f"{record.get('round') or '?'} <@{record.get('winner_id')}> vs <@{record.get('loser_id')}>"
+    source = f"[{match}]({record['message_url']})" if record.get('message_url') else match
+    return f"{record.get('label') or 'a screenshot'} of {source}" + (f" ({when})" if when else "")
+
+async def check_screenshot_duplicates(screenshots: list) -> tuple:
+    """
+    Fingerprint downloaded screenshots and compare them with this submission and earlier results.
     
-    gmt_tz = pytz.timezone('Europe/London')
-    gmt_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(gmt_tz)
-    gmt_formatted = gmt_time.strftime("%A, %d %B, %Y %H:%M")
+    Exact byte duplicates are removed from screenshots (and closed) so they aren't uploaded again.
+    Returns (notes, reused): notes are judge-facing warnings, reused are embed lines linking
+    the earlier copy of each removed screenshot.
+    """
+    if not screenshots:
+        return [], []
+    loop = asyncio.get_running_loop()
+    executor = get_screenshot_executor()
+    started = perf_counter()
+    fingerprints = await asyncio.gather(
+        *(loop.run_in_executor(executor, fingerprint_screenshot, screenshot['fp']) for screenshot in screenshots)
+    )
     
-    return {
-        'minutes_remaining': minutes_remaining,
-        'utc_time': utc_time_str,
-        'utc_time_simple': event_datetime.strftime("%H:%M UTC"),
-        'local_time': local_time_formatted,
-        'ist_time': ist_formatted,
-        'est_time': est_formatted,
-        'gmt_time': gmt_formatted
-    }
+    lookup_started = perf_counter()
+    notes, reused, duplicates = [], [], []
+    seen = {}
+    for screenshot, (sha256, dhash) in zip(screenshots, fingerprints):
+        screenshot['sha256'] = sha256
+        screenshot['dhash'] = dhash
+        label = screenshot['label']
+        if sha256 in seen:
+            notes.append(f"{label} is the same image as {seen[sha256]}; uploaded once")
+            reused.append(f"{label} = {seen[sha256]}")
+            duplicates.append(screenshot)
+            continue
+        seen[sha256] = label
+        
+        earlier = screenshot_index.find_exact(sha256)
+        if earlier is not None:
+            notes.append(f"{label} is identical to {describe_screenshot_record(earlier)}; linked instead of uploaded again")
+            earlier_post = f"[earlier result]({earlier['message_url']})" if earlier.get('message_url') else "an earlier result"
+            reused.append(f"{label} = {earlier.get('label') or 'screenshot'} of {earlier_post}")
+            duplicates.append(screenshot)
+            continue
+        if dhash is not None:
+            similar = screenshot_index.find_similar(dhash)
+            if similar:
+                distance, record = similar[0]
+                notes.append(f"{label} looks like {describe_screenshot_record(record)} ({distance}/{DHASH_BITS} bits apart)")
+    
+    lookup_ms = (perf_counter() - lookup_started) * 1000
+    print(f"Screenshot duplicate check: {len(screenshots)} screenshot(s) against {len(screenshot_index)} indexed, "
+          f"{len(notes)} flagged, lookups {lookup_ms:.2f}ms (fingerprinting {(perf_counter() - started) * 1000:.0f}ms)")
+    
+    for duplicate in duplicates:
+        screenshots.remove(duplicate)
+    close_screenshots(duplicates)
+    return notes, reused
 
-def has_event_create_permission(interaction):
-    """Check if user has permission to create events (Organizers, Helpers Tournament, or Bot Owner)"""
-    # Bot owner has access to all commands
-    if interaction.user.id == BOT_OWNER_ID:
-        return True
+def record_screenshot_fingerprints(screenshots: list, result: dict, message_url: Optional[str]):
+    """Index and persist the screenshots uploaded with a posted result"""
+    records = []
+    for screenshot in screenshots:
+        if 'sha256' not in screenshot:
+            continue
+        record = {
+            'dhash': f"{screenshot['dhash']:016x}" if screenshot['dhash'] is not None else None,
+            'sha256': screenshot['sha256'],
+            'label': screenshot['label'],
+            'channel_id': result.get('channel_id'),
+            'tournament': result.get('tournament'),
+            'round': result.get('round'),
+            'winner_id': result.get('winner_id'),
+            'loser_id': result.get('loser_id'),
+            'message_url': message_url,
+            'created_at': result.get('created_at'),
+        }
+        screenshot_index.add(record)
+        records.append(record)
+    if records:
+        persist_screenshot_hashes(records)
+
+# ===========================================================================================
+# TEAM BALANCING
+# ===========================================================================================
+
+# Rosters larger than this are balanced on a worker thread instead of the event loop
+TEAM_BALANCE_INLINE_PLAYERS = 16
+
+# Upper bound on (highest level - lowest level) * team size, which sets the width of the DP bitsets;
+# rosters with wider level spans are split with a meet-in-the-middle search instead
+TEAM_BALANCE_MAX_SPAN = 1_000_000
+
+def balance_teams(levels: list, top_k: int = 1) -> list:
+    """
+    Split an even roster into two equal-size teams with the smallest level difference.
     
-    organizers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizers"])
-    helpers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["helpers_tournament"])
-    return organizers_role is not None or helpers_role is not None
+    Exact subset-sum DP: reach[c] is a bitset of the team totals reachable with c players,
+    built over groups of equal levels so every split found is a different mix of levels.
+    Levels are shifted down by the lowest level first (both teams lose the same amount,
+    so differences are unchanged and the bitsets stay narrow). When the level span is too
+    wide for bitsets, an exact meet-in-the-middle search over the two roster halves is used.
+    Returns up to top_k (team_a, team_b) level lists, best first, each in input order.
+    """
+    n = len(levels)
+    team_size = n // 2
+    lowest = min(levels)
+    shifted = [level - lowest for level in levels]
+    
+    counts = collections.Counter(shifted)
+    groups = sorted(counts.items())
+    
+    if max(shifted) * team_size > TEAM_BALANCE_MAX_SPAN:
+        splits = _balance_splits_mitm(shifted, groups, team_size, top_k)
+    else:
+        splits = _balance_splits_dp(groups, team_size, top_k)
+    
+    results = []
+    for chosen in splits:
+        # Hand the first `taken` players of each level to team A, keeping input order
+        remaining = {value: taken for (value, _), taken in zip(groups, chosen)}
+        team_a, team_b = [], []
+        for level, value in zip(levels, shifted):
+            if remaining[value]:
+                remaining[value] -= 1
+                team_a.append(level)
+            else:
+                team_b.append(level)
+        results.append((team_a, team_b))
+    return results
 
-def has_event_result_permission(interaction):
-    """Check if user has permission to post event results (Organizers, Helpers Tournament, or Bot Owner)"""
-    # Bot owner has access to all commands
-    if interaction.user.id == BOT_OWNER_ID:
-        return True
+def _balance_splits_dp(groups: list, team_size: int, top_k: int) -> list:
+    """Best team A level mixes (players taken per group) from the bitset DP"""
+    # snapshots[g][c]: totals reachable with c players from the first g groups
+    reach = [1] + [0] * team_size
+    snapshots = [reach]
+    for value, count in groups:
+        updated = list(reach)
+        for c in range(1, team_size + 1):
+            for taken in range(1, min(count, c) + 1):
+                updated[c] |= reach[c - taken] << (value * taken)
+        reach = updated
+        snapshots.append(reach)
     
-    organizers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizers"])
-    helpers_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["helpers_tournament"])
-    return organizers_role is not None or helpers_role is not None
+    total = sum(value * count for value, count in groups)
+    splits = []
+    
+    def compositions(g: int, players: int, target: int, chosen: list):
+        """Yield how many of each level team A takes, for every mix of players/target from the first g groups"""
+        if g == 0:
+            yield list(chosen)
+            return
+        value, count = groups[g - 1]
+        for taken in range(min(count, players) + 1):
+            rest = target - value * taken
+            if rest < 0:
+                break
+            if snapshots[g - 1][players - taken] >> rest & 1:
+                chosen[g - 1] = taken
+                yield from compositions(g - 1, players - taken, rest, chosen)
+    
+    # Team A totals from the middle outwards; totals above half are the same splits with teams swapped
+    for team_total in range(total // 2, -1, -1):
+        if not reach[team_size] >> team_total & 1:
+            continue
+        for chosen in compositions(len(groups), team_size, team_total, [0] * len(groups)):
+            if 2 * team_total == total:
+                # Exactly even: the complement has the same total, keep one of the pair
+                complement = [count - taken for (_, count), taken in zip(groups, chosen)]
+                if complement < chosen:
+                    continue
+            splits.append(chosen)
+            if len(splits) >= top_k:
+                break
+        if len(splits) >= top_k:
+            break
+    return splits
 
-@bot.event
-async def on_ready():
-    print(f"✅ Bot is online as {bot.user}")
-    print(f"🆔 Bot ID: {bot.user.id}")
-    print(f"📊 Connected to {len(bot.guilds)} guild(s)")
+def _balance_splits_mitm(shifted: list, groups: list, team_size: int, top_k: int) -> list:
+    """
+    Best team A level mixes (players taken per group) by meet-in-the-middle.
+    
+    Every team A is some players from the first half of the roster plus the rest from the
+    second half. Second-half sums are sorted per player count; for each first-half subset the
+    sums just below half the total are walked downwards until they can no longer beat the
+    top_k best distinct mixes found so far.
+    """
+    total = sum(shifted)
+    half = total // 2
+    group_of = {value: g for g, (value, _) in enumerate(groups)}
+    middle = len(shifted) // 2
+    left, right = range(middle), range(middle, len(shifted))
     
-    # Load scheduled events from file
-    load_scheduled_events()
+    # right_sums[c]: (sums, player index tuples) of c-player second-half subsets, sorted by sum
+    right_sums = {}
+    for c in range(max(0, team_size - len(left)), min(team_size, len(right)) + 1):
+        subsets = sorted((sum(shifted[i] for i in combo), combo) for combo in itertools.combinations(right, c))
+        right_sums[c] = ([subset_sum for subset_sum, _ in subsets], [combo for _, combo in subsets])
     
-    # Load tournament rules from file
-    load_rules()
+    best = {}  # {tuple(chosen): difference}, at most top_k distinct mixes
     
-    # Reschedule cleanups for any events already marked finished_on if needed (optional)
+    for taken_left in range(max(0, team_size - len(right)), min(team_size, len(left)) + 1):
+        sums, combos = right_sums[team_size - taken_left]
+        for left_combo in itertools.combinations(left, taken_left):
+            left_sum = sum(shifted[i] for i in left_combo)
+            # Team A totals at most half the total; larger totals are the same splits swapped
+            position = bisect.bisect_right(sums, half - left_sum) - 1
+            limit = max(best.values()) if len(best) >= top_k else float('inf')
+            while position >= 0:
+                difference = total - 2 * (left_sum + sums[position])
+                if difference >= limit:
+                    break
+                chosen = [0] * len(groups)
+                for i in left_combo + combos[position]:
+                    chosen[group_of[shifted[i]]] += 1
+                if difference == 0:
+                    # Exactly even: the complement is the same split, keep one of the pair
+                    complement = [count - taken for (_, count), taken in zip(groups, chosen)]
+                    chosen = min(chosen, complement)
+                key = tuple(chosen)
+                if key not in best:
+                    best[key] = difference
+                    if len(best) > top_k:
+                        del best[max(best, key=best.get)]
+                    if len(best) >= top_k:
+                        limit = max(best.values())
+                position -= 1
+    
+    ranked = sorted(best.items(), key=lambda item: item[1])[:top_k]
+    return [list(key) for key, _ in ranked]
+
+def format_team_split(team_a: list, team_b: list) -> str:
+    sum_a = sum(team_a)
+    sum_b = sum(team_b)
+    return (
+        f"**Team A:** {team_a} | Total Level: {sum_a}\n"
+        f"**Team B:** {team_b} | Total Level: {sum_b}\n"
+        f"**Level Difference:** {abs(sum_a - sum_b)}"
+    )
+
+# ===========================================================================================
+# STARTUP
+# ===========================================================================================
+
+# Hash of the command tree as of the last successful sync
+COMMAND_SYNC_HASH_FILE = CACHE_DIR / "command_tree.sha256"
+
+# Set to 1 to sync slash commands even if the command tree hash is unchanged
+FORCE_COMMAND_SYNC = os.environ.get("FORCE_COMMAND_SYNC", "0") == "1"
+
+def command_payload(command) -> dict:
+    """A command's sync payload; discord.py 2.4 added the tree argument to to_dict()"""
+    try:
+        return command.to_dict(tree)
+    except TypeError:
+        return command.to_dict()
+
+def command_tree_hash() -> str:
+    """Stable hash of the slash command payload Discord would receive from tree.sync()"""
+    payload = sorted(
+        (command_payload(command) for command in tree.get_commands()),
+        key=lambda command: (command.get('type', 1), command['name'])
+    )
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    # Commands are registered per application, so a different bot token needs its own sync
+    digest.update(str(bot.application_id).encode('utf-8'))
+    return digest.hexdigest()
+
+async def sync_commands_if_changed():
+    """Sync slash commands only when the command tree changed since the last sync"""
+    try:
+        tree_hash = command_tree_hash()
+        try:
+            last_hash = COMMAND_SYNC_HASH_FILE.read_text(encoding='utf-8').strip()
+        except OSError:
+            last_hash = None
+        if tree_hash == last_hash and not FORCE_COMMAND_SYNC:
+            print("✅ Slash commands unchanged since last sync, skipping sync")
+            return
+        
+        print("🔄 Syncing slash commands...")
+        synced = await asyncio.wait_for(tree.sync(), timeout=30.0)
+        print(f"✅ Synced {len(synced)} command(s)")
+        COMMAND_SYNC_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        COMMAND_SYNC_HASH_FILE.write_text(tree_hash, encoding='utf-8')
+    except asyncio.TimeoutError:
+        print("⚠️ Command sync timed out, but bot will continue running")
+    except Exception as e:
+        print(f"❌ Error syncing commands: {e}")
+        print("⚠️ Bot will continue running without command sync")
+
+async def cleanup_stale_events():
+    """Clean up events older than 7 days (a backstop for cleanups that never ran)"""
     try:
         for ev_id, data in list(scheduled_events.items()):
-            # If previously scheduled cleanup exists, skip (it won't persist); we don't know result time here
-            # Optionally: clean up events older than 7 days to avoid clutter
             try:
                 dt = data.get('datetime')
                 if isinstance(dt, datetime.datetime):
                     age_days = (datetime.datetime.now() - dt).days
                     if age_days >= 7:
                         # Hard cleanup very old events
-                        if ev_id in reminder_tasks:
-                            try:
-                                reminder_tasks[ev_id].cancel()
-                                del reminder_tasks[ev_id]
-                            except Exception:
-                                pass
+                        timer_scheduler.cancel_event(ev_id)
+                        judge_id = event_member_id(data, 'judge')
+                        if judge_id:
+                            remove_judge_assignment(judge_id, ev_id)
                         del scheduled_events[ev_id]
+                        persist_event(ev_id)
             except Exception:
                 pass
-        save_scheduled_events()
+        # Compact storage (JSON snapshot/journal or SQLite WAL)
+        await save_scheduled_events()
     except Exception as e:
         print(f"Startup cleanup sweep error: {e}")
-    
-    # Sync commands with timeout handling
+
+def preload_deferred_modules():
+    """Import the lazily imported modules (Pillow, requests, pytz) ahead of first use"""
+    for module in (pytz, requests, Image, ImageDraw, ImageFilter, ImageFont):
+        module._load()
+
+async def warm_poster_pipeline():
+    """Warm deferred imports, the poster font cache and render workers in the background"""
+    # Off the event loop so the first /event-create doesn't import Pillow or download fonts
     try:
-        print("🔄 Syncing slash commands...")
-        import asyncio
-        synced = await asyncio.wait_for(tree.sync(), timeout=30.0)
-        print(f"✅ Synced {len(synced)} command(s)")
-    except asyncio.TimeoutError:
-        print("⚠️ Command sync timed out, but bot will continue running")
+        await asyncio.to_thread(preload_deferred_modules)
+        await asyncio.to_thread(warm_font_cache)
     except Exception as e:
-        print(f"❌ Error syncing commands: {e}")
-        print("⚠️ Bot will continue running without command sync")
+        print(f"Font cache warmup error: {e}")
+    
+    # Start poster render workers with fonts preloaded
+    await warm_render_executor()
+
+@bot.event
+async def setup_hook():
+    """One-time startup work, run once per process before connecting to the gateway"""
+    startup_profiler.mark("login")
+    
+    # Load scheduled events from storage
+    await load_scheduled_events()
+    startup_profiler.mark("load scheduled events")
+    
+    # Re-arm reminders and cleanups that were pending before the restart
+    await load_timer_jobs()
+    startup_profiler.mark("restore timer jobs")
+    
+    # Index screenshots from earlier results for duplicate detection
+    await load_screenshot_index()
+    startup_profiler.mark("screenshot index")
+    
+    # Load tournament rules from file
+    await asyncio.to_thread(load_rules)
+    startup_profiler.mark("load rules")
+    
+    # Pending cleanups were restored with the timer jobs; old events are swept as a backstop
+    await cleanup_stale_events()
+    startup_profiler.mark("stale event sweep")
+    
+    # Sync commands only if they changed since the last sync
+    await sync_commands_if_changed()
+    startup_profiler.mark("command sync")
+
+_discord_close = bot.close
+
+async def close_bot():
+    """Let running timer jobs and debounced writes finish before the connection closes"""
+    await timer_scheduler.shutdown()
+    await persistence_writer.close()
+    await _discord_close()
+
+# bot.run() calls close() on Ctrl+C and on shutdown, while the event loop is still running
+bot.close = close_bot
+
+@bot.event
+async def on_ready():
+    # Runs again on every gateway reconnect; one-time startup work lives in setup_hook
+    print(f"✅ Bot is online as {bot.user}")
+    print(f"🆔 Bot ID: {bot.user.id}")
+    print(f"📊 Connected to {len(bot.guilds)} guild(s)")
+    
+    if not startup_profiler.reported:
+        startup_profiler.mark("gateway connect")
+        startup_profiler.report()
+        # Posters are not needed to come online, so warm them up once the bot is ready
+        if STARTUP_WARMUP:
+            asyncio.create_task(warm_poster_pipeline())
     
     print("🎯 Bot is ready to receive commands!")
 
@@ -1312,39 +4213,31 @@ async def rules_command(interaction: discord.Interaction):
         await interaction.response.send_message("❌ An error occurred while processing the rules command.", ephemeral=True)
     
 @tree.command(name="team_balance", description="Balance two teams based on player levels")
-@app_commands.describe(levels="Comma-separated player levels (e.g. 48,50,51,35,51,50,50,37,51,52)")
-async def team_balance(interaction: discord.Interaction, levels: str):
+@app_commands.describe(
+    levels="Comma-separated player levels (e.g. 48,50,51,35,51,50,50,37,51,52)",
+    alternatives="Next-best splits to list after the best one (0-5)"
+)
+async def team_balance(interaction: discord.Interaction, levels: str, alternatives: int = 0):
     try:
         level_list = [int(x.strip()) for x in levels.split(",") if x.strip()]
         n = len(level_list)
+        if n == 0:
+            await interaction.response.send_message("❌ Please provide player levels (e.g., 48,50,51,35).", ephemeral=True)
+            return
         if n % 2 != 0:
             await interaction.response.send_message("❌ Number of players must be even (e.g., 8 or 10).", ephemeral=True)
             return
 
-        team_size = n // 2
-        min_diff = float('inf')
-        best_team_a = []
-        for combo in combinations(level_list, team_size):
-            team_a = list(combo)
-            team_b = list(level_list)
-            for lvl in team_a:
-                team_b.remove(lvl)
-            diff = abs(sum(team_a) - sum(team_b))
-            if diff < min_diff:
-                min_diff = diff
-                best_team_a = team_a
-        team_b = list(level_list)
-        for lvl in best_team_a:
-            team_b.remove(lvl)
-        sum_a = sum(best_team_a)
-        sum_b = sum(team_b)
-        diff = abs(sum_a - sum_b)
-        await interaction.response.send_message(
-            f"**Team A:** {best_team_a} | Total Level: {sum_a}\n"
-            f"**Team B:** {team_b} | Total Level: {sum_b}\n"
-            f"**Level Difference:** {diff}",
-            ephemeral=True
-        )
+        top_k = 1 + max(0, min(5, alternatives))
+        if n > TEAM_BALANCE_INLINE_PLAYERS:
+            splits = await asyncio.to_thread(balance_teams, level_list, top_k)
+        else:
+            splits = balance_teams(level_list, top_k)
+        
+        message = format_team_split(*splits[0])
+        for rank, (team_a, team_b) in enumerate(splits[1:], 2):
+            message += f"\n\n**Alternative {rank - 1}:**\n{format_team_split(team_a, team_b)}"
+        await interaction.response.send_message(message, ephemeral=True)
     except Exception as e:
         await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
 
@@ -1457,17 +4350,18 @@ async def event_create(
         'team2_captain': team_2_captain
     }
     
-    # Save events to file
-    save_scheduled_events()
+    # Persist the new event
+    persist_event(event_id)
     
-    # Get random template image and create poster
-    template_image = get_random_template()
+    # Get a template (seeded by the match so a re-created event gets the same cached poster) and create poster
+    template_seed = f"{round_label}|{team_1_captain.id}|{team_2_captain.id}|{event_datetime.isoformat()}|{tournament}"
+    template_image = get_random_template(seed=template_seed)
     poster_image = None
     
     if template_image:
         try:
-            # Create poster with text overlays
-            poster_image = create_event_poster(
+            # Create poster with text overlays in the render pool
+            poster_image, poster_info = await render_event_poster(
                 template_image, 
                 round_label, 
                 team_1_captain.name, 
@@ -1477,9 +4371,9 @@ async def event_create(
                 tournament
             )
             if poster_image:
-                # Keep poster path for later cleanup/deletion
-                scheduled_events[event_id]['poster_path'] = poster_image
-                save_scheduled_events()
+                print(f"Poster for event {event_id}: {format_encode_info(poster_info)}")
+                # Archive a copy to disk only when POSTER_ARCHIVE_DIR is configured
+                await asyncio.to_thread(archive_poster, event_id, poster_image)
         except Exception as e:
             print(f"Error creating poster: {e}")
             poster_image = None
@@ -1529,57 +4423,72 @@ async def event_create(
     
     embed.add_field(name="👤 Created By", value=interaction.user.mention, inline=False)
     
-    # Add poster image if available
+    # Add poster image if available (the extension follows the encoder's chosen format)
+    poster_filename = f"event_poster.{poster_file_extension(poster_image)}" if poster_image else None
     if poster_image:
-        try:
-            with open(poster_image, 'rb') as f:
-                file = discord.File(f, filename="event_poster.png")
-                embed.set_image(url="attachment://event_poster.png")
-        except Exception as e:
-            print(f"Error loading poster image: {e}")
+        embed.set_image(url=f"attachment://{poster_filename}")
     
     embed.set_footer(text="Event Management • ICF Tournament Bot")
     
     # Create Take Schedule button
     take_schedule_view = TakeScheduleButton(event_id, team_1_captain, team_2_captain, interaction.channel)
     
-    # Send confirmation to user
-    await interaction.followup.send("✅ Event created and posted to both channels! Reminder will ping captains 10 minutes before start.", ephemeral=True)
-    
-    # Post in schedules channel (with button)
-    try:
+    async def post_schedule():
+        """Post in schedules channel (with button)"""
         schedule_channel = interaction.guild.get_channel(CHANNEL_IDS["schedules"])
-        if schedule_channel:
-            judge_ping = f"<@&{ROLE_IDS['helpers_tournament']}> <@&{ROLE_IDS['organizers']}>"
-            if poster_image:
-                with open(poster_image, 'rb') as f:
-                    file = discord.File(f, filename="event_poster.png")
-                    schedule_message = await schedule_channel.send(content=judge_ping, embed=embed, file=file, view=take_schedule_view)
-            else:
-                schedule_message = await schedule_channel.send(content=judge_ping, embed=embed, view=take_schedule_view)
-            
-            # Store the message ID for later deletion
-            scheduled_events[event_id]['schedule_message_id'] = schedule_message.id
-            scheduled_events[event_id]['schedule_channel_id'] = schedule_channel.id
-        else:
-            await interaction.followup.send("⚠️ Could not find schedules channel.", ephemeral=True)
-    except Exception as e:
-        await interaction.followup.send(f"⚠️ Could not post in schedules channel: {e}", ephemeral=True)
-    
-    # Post in the channel where command was used (without button)
-    try:
+        if not schedule_channel:
+            raise RuntimeError("channel not found")
+        judge_ping = f"<@&{ROLE_IDS['helpers_tournament']}> <@&{ROLE_IDS['organizers']}>"
         if poster_image:
-            with open(poster_image, 'rb') as f:
-                file = discord.File(f, filename="event_poster.png")
-                await interaction.channel.send(embed=embed, file=file)
+            # BytesIO over the immutable poster bytes shares the buffer instead of copying it
+            file = discord.File(io.BytesIO(poster_image), filename=poster_filename)
+            schedule_message = await send_channel_message(schedule_channel, PRIORITY_NOTIFICATION, content=judge_ping, embed=embed, file=file, view=take_schedule_view)
         else:
-            await interaction.channel.send(embed=embed)
-
-        # Schedule the 10-minute reminder
-        await schedule_ten_minute_reminder(event_id, team_1_captain, team_2_captain, None, interaction.channel, event_datetime)
+            schedule_message = await send_channel_message(schedule_channel, PRIORITY_NOTIFICATION, content=judge_ping, embed=embed, view=take_schedule_view)
         
-    except Exception as e:
-        await interaction.followup.send(f"⚠️ Could not post in current channel: {e}", ephemeral=True)
+        # Store the message ID for later deletion
+        scheduled_events[event_id]['schedule_message_id'] = schedule_message.id
+        scheduled_events[event_id]['schedule_channel_id'] = schedule_channel.id
+        persist_event(event_id)
+        return schedule_message
+    
+    schedule_task = asyncio.create_task(post_schedule())
+    
+    async def post_origin():
+        """Post in the channel where command was used (without button)"""
+        if not poster_image:
+            # Nothing to reuse, so this post doesn't wait for the schedules channel
+            return await send_channel_message(interaction.channel, PRIORITY_NOTIFICATION, embed=embed)
+        # Show the poster already uploaded with the schedule post instead of uploading it again
+        try:
+            schedule_message = await schedule_task
+        except Exception:
+            schedule_message = None
+        poster_urls = message_image_urls(schedule_message)
+        reuse_kwargs = None
+        if poster_urls:
+            origin_embed = embed.copy()
+            origin_embed.set_image(url=poster_urls[0])
+            reuse_kwargs = {'embed': origin_embed}
+        return await send_reusing_media(
+            interaction.channel, PRIORITY_NOTIFICATION, reuse_kwargs,
+            lambda: {'embed': embed, 'file': discord.File(io.BytesIO(poster_image), filename=poster_filename)},
+            len(poster_image)
+        )
+    
+    async def arm_reminder():
+        """Schedule the 10-minute reminder"""
+        await schedule_ten_minute_reminder(event_id, event_datetime)
+        return True
+    
+    report = await fan_out({
+        "Schedules channel": schedule_task,
+        "Current channel": post_origin(),
+        "10-minute reminder": arm_reminder(),
+    })
+    
+    # Send one confirmation covering every destination
+    await interaction.followup.send(f"✅ Event created!\n{format_fanout_report(report)}", ephemeral=True)
 
 @tree.command(name="event-result", description="Add event results (Organizers/Helpers Tournament only)")
 @app_commands.describe(
@@ -1590,6 +4499,8 @@ async def event_create(
     tournament="Tournament name (e.g., The Zumwalt S2)",
     round="Round name",
     remarks="Remarks about the match (e.g., ggwp, close match)",
+    original_screenshots="Post screenshots at full size instead of downscaled and recompressed",
+    contact_sheet="Combine the screenshots into one or two labelled contact-sheet images",
     ss_1="Screenshot 1 (upload)",
     ss_2="Screenshot 2 (upload)",
     ss_3="Screenshot 3 (upload)",
@@ -1629,6 +4540,8 @@ async def event_result(
     tournament: str,
     round: app_commands.Choice[str],
     remarks: str = "ggwp",
+    original_screenshots: bool = False,
+    contact_sheet: bool = False,
     ss_1: discord.Attachment = None,
     ss_2: discord.Attachment = None,
     ss_3: discord.Attachment = None,
@@ -1656,6 +4569,17 @@ async def event_result(
         await interaction.followup.send("❌ Scores cannot be negative", ephemeral=True)
         return
             
+    results_channel = interaction.guild.get_channel(CHANNEL_IDS["match_results"])
+    origin_channel = interaction.channel
+    
+    if not results_channel:
+        await interaction.followup.send("⚠️ Could not find Results channel.", ephemeral=True)
+        return
+    
+    if not origin_channel:
+        await interaction.followup.send("⚠️ Could not determine origin channel.", ephemeral=True)
+        return
+    
     # Resolve round label from choice
     round_label = round.value if isinstance(round, app_commands.Choice) else str(round)
     
@@ -1688,115 +4612,111 @@ async def event_result(
     # Remarks Section
     embed.add_field(name="📝 Remarks", value=remarks, inline=False)
     
-    # Handle screenshots - collect them and send as files (no image embeds)
-    screenshots = [ss_1, ss_2, ss_3, ss_4, ss_5, ss_6, ss_7, ss_8, ss_9, ss_10, ss_11]
-    files_to_send = []
-    screenshot_names = []
+    # Handle screenshots - download them concurrently and send as files (no image embeds)
+    screenshots, screenshot_problems = await ingest_screenshots([ss_1, ss_2, ss_3, ss_4, ss_5, ss_6, ss_7, ss_8, ss_9, ss_10, ss_11])
+    screenshot_names = [screenshot['label'] for screenshot in screenshots]
     
-    for i, screenshot in enumerate(screenshots, 1):
-        if screenshot:
-            # Create a file object for each screenshot
-            try:
-                file_data = await screenshot.read()
-                file_obj = discord.File(
-                    fp=io.BytesIO(file_data),
-                    filename=f"SS-{i}_{screenshot.filename}"
-                )
-                files_to_send.append(file_obj)
-                screenshot_names.append(f"SS-{i}")
-            except Exception as e:
-                print(f"Error processing screenshot {i}: {e}")
+    # Flag screenshots seen before; exact duplicates are linked instead of uploaded again
+    duplicate_notes, reused_screenshots = await check_screenshot_duplicates(screenshots)
+    screenshot_problems.extend(duplicate_notes)
+    fingerprinted_screenshots = list(screenshots)
+    
+    # Contact sheets are labelled with the same SS-n names listed in the embed
+    sheets = await build_contact_sheets(screenshots) if contact_sheet and len(screenshots) > 1 else None
+    if sheets:
+        screenshots = sheets
+    elif not original_screenshots:
+        await optimize_screenshots(screenshots)
+    files_to_send = screenshot_files(screenshots)
     
     # Add screenshot section if any screenshots were provided
     if screenshot_names:
         screenshot_text = f"**Screenshots of Result ({len(screenshot_names)} images)**\n"
         screenshot_text += f"📷 {' • '.join(screenshot_names)}"
+        for line in reused_screenshots:
+            # Embed field values are capped at 1024 characters
+            if len(screenshot_text) + len(line) + 3 > 1020:
+                screenshot_text += "\n🔁 …"
+                break
+            screenshot_text += f"\n🔁 {line}"
         embed.add_field(name="", value=screenshot_text, inline=False)
     
     embed.set_footer(text="Event Results • ICF Tournament Bot")
     
-    # Post results using dual-channel functionality
-    try:
-        results_channel = interaction.guild.get_channel(CHANNEL_IDS["match_results"])
-        origin_channel = interaction.channel
-        
-        if not results_channel:
-            await interaction.followup.send("⚠️ Could not find Results channel.", ephemeral=True)
-            return
-        
-        if not origin_channel:
-            await interaction.followup.send("⚠️ Could not determine origin channel.", ephemeral=True)
-            return
-        
-        # Use ResultManager for dual-channel posting
-        results_success, origin_success = await ResultManager.post_result_dual_channel(
-            embed=embed,
-            files=files_to_send,
-            origin_channel=origin_channel,
-            results_channel=results_channel
-        )
-        
-        # Provide feedback based on posting results
-        if results_success and origin_success:
-            if ResultManager.should_duplicate_post(origin_channel, results_channel):
-                await interaction.followup.send("✅ Event results posted to Results channel and current channel! Staff Attendance logged!", ephemeral=True)
-            else:
-                await interaction.followup.send("✅ Event results posted to Results channel and Staff Attendance logged!", ephemeral=True)
-        elif results_success:
-            await interaction.followup.send("✅ Event results posted to Results channel! ⚠️ Could not post to current channel. Staff Attendance logged!", ephemeral=True)
-        elif origin_success:
-            await interaction.followup.send("⚠️ Could not post to Results channel, but posted to current channel. Staff Attendance logged!", ephemeral=True)
-        else:
-            await interaction.followup.send("❌ Failed to post results to both channels. Please try again.", ephemeral=True)
-            return
-            
-    except Exception as e:
-        await interaction.followup.send(f"❌ Error posting results: {e}", ephemeral=True)
+    # Screenshots are uploaded once with the results post; the origin copy reuses them
+    results_task = asyncio.create_task(ResultManager.post_result_to_channel(results_channel, embed, files_to_send))
+    
+    async def post_origin():
+        try:
+            results_message = await results_task
+        except Exception:
+            results_message = None
+        return await ResultManager.post_origin_copy(results_message, embed, files_to_send, origin_channel)
+    
+    async def post_attendance():
+        """Post staff attendance in match_reports channel"""
+        reports_channel = interaction.guild.get_channel(CHANNEL_IDS["match_reports"])
+        if not reports_channel:
+            raise RuntimeError("channel not found")
+        attendance_text = f"🏅 {winner.display_name} Vs {loser.display_name}\n"
+        attendance_text += f"**Round :** {round_label}\n\n"
+        attendance_text += f"**Results**\n"
+        attendance_text += f"🏆 {winner.display_name} ({winner_score}) Vs ({loser_score}) {loser.display_name} 💀\n\n"
+        attendance_text += f"**Staffs**\n"
+        attendance_text += f"• Judge: {interaction.user.mention} @{interaction.user.name}"
+        return await send_channel_message(reports_channel, PRIORITY_BULK, content=attendance_text)
+    
+    branches = {"Results channel": results_task}
+    # Post to origin channel only if it's different from results channel
+    if ResultManager.should_duplicate_post(origin_channel, results_channel):
+        branches["Current channel"] = post_origin()
+    branches["Staff attendance"] = post_attendance()
+    report = await fan_out(branches)
+    close_screenshots(screenshots)
+    
+    problems_text = "".join(f"\n⚠️ {problem}" for problem in screenshot_problems)
+    posted_anywhere = report["Results channel"][0] or report.get("Current channel", (False, None))[0]
+    if not posted_anywhere:
+        await interaction.followup.send(f"❌ Failed to post results. Please try again.\n{format_fanout_report(report)}{problems_text}", ephemeral=True)
         return
 
-    # Winner-only summary removed per request
+    # Record the result in storage
+    result = {
+        'channel_id': interaction.channel.id if interaction.channel else None,
+        'tournament': tournament,
+        'round': round_label,
+        'winner_id': winner.id,
+        'winner_score': winner_score,
+        'loser_id': loser.id,
+        'loser_score': loser_score,
+        'judge_id': interaction.user.id,
+        'remarks': remarks,
+        'created_at': datetime.datetime.utcnow().isoformat()
+    }
+    persist_result(result)
+    
+    # Remember the uploaded screenshots so later submissions of the same images are flagged
+    results_message = results_task.result() if not results_task.exception() else None
+    record_screenshot_fingerprints(fingerprinted_screenshots, result, results_message.jump_url if results_message else None)
 
-    # Post staff attendance in match_reports channel
-    try:
-        reports_channel = interaction.guild.get_channel(CHANNEL_IDS["match_reports"])
-        if reports_channel:
-            attendance_text = f"🏅 {winner.display_name} Vs {loser.display_name}\n"
-            attendance_text += f"**Round :** {round_label}\n\n"
-            attendance_text += f"**Results**\n"
-            attendance_text += f"🏆 {winner.display_name} ({winner_score}) Vs ({loser_score}) {loser.display_name} 💀\n\n"
-            attendance_text += f"**Staffs**\n"
-            attendance_text += f"• Judge: {interaction.user.mention} @{interaction.user.name}"
-
-            await reports_channel.send(attendance_text)
-        else:
-            print("⚠️ Could not find match reports channel.")
-    except Exception as e:
-        print(f"⚠️ Could not post in match reports channel: {e}")
+    # Winner-only summary removed per request
 
     # Schedule auto-cleanup of matching events in this channel after 36 hours
+    summary = f"✅ Event results posted!\n{format_fanout_report(report)}{problems_text}"
     try:
         current_channel_id = interaction.channel.id if interaction.channel else None
-        matching_event_ids = []
-        for ev_id, data in scheduled_events.items():
-            if data.get('channel_id') == current_channel_id:
-                # Optional: further match by captains to be safer
-                try:
-                    t1 = getattr(data.get('team1_captain'), 'id', None)
-                    t2 = getattr(data.get('team2_captain'), 'id', None)
-                    if winner.id in (t1, t2) and loser.id in (t1, t2):
-                        matching_event_ids.append(ev_id)
-                except Exception:
-                    matching_event_ids.append(ev_id)
-
-        scheduled_any = False
+        # Indexed lookup by channel and both captains
+        matching_event_ids = scheduled_events.events_for_captains(current_channel_id, winner.id, loser.id)
+
         for ev_id in matching_event_ids:
             await schedule_event_cleanup(ev_id, delay_hours=36)
-            scheduled_any = True
 
-        if scheduled_any:
-            await interaction.followup.send("🧹 Auto-cleanup scheduled: Related event(s) will be removed after 36 hours.", ephemeral=True)
+        if matching_event_ids:
+            summary += "\n🧹 Auto-cleanup scheduled: Related event(s) will be removed after 36 hours."
     except Exception as e:
         print(f"Error scheduling auto-cleanup after results: {e}")
+    
+    await interaction.followup.send(summary, ephemeral=True)
 
 @tree.command(name="time", description="Get a random match time from fixed 30-min slots (12:00-17:00 UTC)")
 async def time(interaction: discord.Interaction):
@@ -1937,23 +4857,14 @@ async def unassigned_events(interaction: discord.Interaction):
                 await interaction.response.send_message("❌ You need Organizers or Helpers Tournament role to view unassigned events.", ephemeral=True)
                 return
 
-        # Build list of unassigned events
-        unassigned = []
-        for event_id, data in scheduled_events.items():
-            if not data.get('judge'):
-                unassigned.append((event_id, data))
+        # Build list of unassigned events (indexed lookup, already sorted by datetime)
+        unassigned = [(event_id, scheduled_events[event_id]) for event_id in scheduled_events.unassigned_events()]
 
         # If none, inform
         if not unassigned:
             await interaction.response.send_message("✅ All events currently have a judge assigned.", ephemeral=True)
             return
 
-        # Sort by datetime if present
-        try:
-            unassigned.sort(key=lambda x: x[1].get('datetime') or datetime.datetime.max)
-        except Exception:
-            pass
-
         # Create embed summary
         embed = discord.Embed(
             title="📝 Unassigned Events",
@@ -2164,14 +5075,12 @@ async def event_delete(interaction: discord.Interaction):
                 # Get event details for confirmation
                 event_data = scheduled_events[selected_event_id]
                 
-                # Cancel any scheduled reminders
-                if selected_event_id in reminder_tasks:
-                    reminder_tasks[selected_event_id].cancel()
-                    del reminder_tasks[selected_event_id]
+                # Cancel any scheduled reminder or cleanup
+                timer_scheduler.cancel_event(selected_event_id)
                 
                 # Remove judge assignment if exists
-                if 'judge' in event_data and event_data['judge']:
-                    judge_id = event_data['judge'].id
+                judge_id = event_member_id(event_data, 'judge')
+                if judge_id:
                     remove_judge_assignment(judge_id, selected_event_id)
                 
                 # Delete the original schedule message if it exists
@@ -2188,7 +5097,7 @@ async def event_delete(interaction: discord.Interaction):
                     except Exception as e:
                         print(f"Error deleting schedule message: {e}")
                 
-                # Clean up any temporary poster files
+                # Clean up temporary poster files left by events created before in-memory posters
                 if 'poster_path' in event_data:
                     try:
                         import os
@@ -2200,8 +5109,8 @@ async def event_delete(interaction: discord.Interaction):
                 # Remove from scheduled events
                 del scheduled_events[selected_event_id]
                 
-                # Save events to file
-                save_scheduled_events()
+                # Persist the deletion
+                persist_event(selected_event_id)
                 
                 # Create confirmation embed
                 embed = discord.Embed(
@@ -2289,11 +5198,8 @@ async def exchange_judge(
             return
 
     # Determine target events in the current channel
-    target_event_ids = []
     current_channel_id = interaction.channel.id if interaction.channel else None
-    for ev_id, data in scheduled_events.items():
-        if data.get('channel_id') == current_channel_id and data.get('judge') and getattr(data.get('judge'), 'id', None) == old_judge.id:
-            target_event_ids.append(ev_id)
+    target_event_ids = scheduled_events.events_for_judge(old_judge.id, channel_id=current_channel_id)
 
     if not target_event_ids:
         await interaction.response.send_message("⚠️ No events in this channel are assigned to the old judge.", ephemeral=True)
@@ -2306,7 +5212,8 @@ async def exchange_judge(
         if not data:
             continue
         # Update event's judge
-        data['judge'] = new_judge
+        scheduled_events.update_event(ev_id, judge=new_judge)
+        persist_event(ev_id)
 
         # Update judge_assignments mapping
         try:
@@ -2356,7 +5263,7 @@ async def exchange_judge(
                         value=f"❌ **{old_judge.display_name}** removed from channel\n✅ **{new_judge.display_name}** added to channel",
                         inline=False
                     )
-                    await channel.send(embed=embed)
+                    await send_channel_message(channel, PRIORITY_NOTIFICATION, embed=embed)
         except discord.Forbidden:
             print(f"Error: Bot doesn't have permission to manage channel permissions for {ev_id}")
         except Exception as e:
@@ -2370,6 +5277,8 @@ async def exchange_judge(
 # Ticket Management Commands - Removed as requested
 
 
+startup_profiler.mark("module init")
+
 if __name__ == "__main__":
     # Get Discord token from environment
     token = os.environ.get("DISCORD_TOKEN")
@@ -2401,3 +5310,13 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"❌ Error starting bot: {e}")
         exit(1)
+    finally:
+        # Stop poster render and screenshot workers
+        shutdown_render_executor()
+        shutdown_screenshot_executor()
+        # Write any state changes still waiting in the debounce window
+        persistence_writer.shutdown()
+        # Outbound message stats for this run
+        print(f"Outbound messages: {json.dumps(outbound_dispatcher.metrics()['priorities'])}")
+        if media_reuse_stats['reused']:
+            print(f"Media reuse: {media_reuse_stats['reused']} upload(s) avoided, {media_reuse_stats['bytes_saved'] / 1024:.0f}KB saved")
@@ -0,0 +1,274 @@
+"""
+ICF Tournament Bot - Poster Rendering Benchmarks
+Runs offline against the bundled Templates/ and Fonts/ folders.
+
+Usage:
+    python benchmark.py posters [--posters N] [--output results.json]
+    python benchmark.py outline [--iterations N]
+
+The posters suite renders N posters with varied captain names and rounds and reports
+p50/p95 latency and resident memory growth per stage (decode, resize, template cache,
+font load, sanitize, text, encode, end to end), overall peak RSS and encoded output sizes
+as JSON.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+# Keep benchmarks offline and away from the bot's real caches (removed when main() exits)
+os.environ.setdefault("FONT_OFFLINE", "1")
+_bench_cache_dir = tempfile.TemporaryDirectory(prefix="icf-bench-")
+os.environ.setdefault("ICF_CACHE_DIR", _bench_cache_dir.name)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import PIL
+from PIL import Image, ImageChops, ImageDraw
+
+import app
+
+# Strings drawn on every poster with the font they use
+OUTLINE_SAMPLES = [
+    ("ICF Tournament Bot", "title"),
+    ("ROUND R1", "round"),
+    ("Captain_One", "vs"),
+    (" VS ", "vs"),
+    ("Captain_Two", "vs"),
+    ("DATE:  01/01/2026", "time"),
+    ("TIME:  12:00 UTC", "time"),
+]
+
+# Captain names covering plain, decorated and non-Latin display names
+CAPTAIN_NAMES = [
+    "NavalLegend42", "xX_Sn1per_Xx", "Alpha Wolf", "José", "Zoë", "Капитан",
+    "Морской_Волк", "船長", "ミカ", "Ψ Poseidon Ψ", "⚓ Admiral ⚓", "captain.jack",
+]
+
+ROUNDS = ["R1", "R2", "R3", "R4", "R5", "R6", "R7", "R8", "R9", "R10", "Qualifier", "Semi Final", "Bronze", "Final"]
+
+STAGES = ["decode", "resize", "template_cache", "font_load", "sanitize", "text", "encode", "end_to_end"]
+
+def percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def summarize(values: list) -> dict:
+    """p50/p95/mean/max of a list of measurements"""
+    return {
+        'p50': round(percentile(values, 0.50), 3),
+        'p95': round(percentile(values, 0.95), 3),
+        'mean': round(sum(values) / len(values), 3),
+        'max': round(max(values), 3),
+    }
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (0 where unsupported)"""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+def current_rss_mb() -> float:
+    """Current resident set size of this process in MB (0 where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0.0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the bot's progress prints while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def timed(func, *args, **kwargs):
+    """Run func and return (result, elapsed milliseconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+def read_text_file(path: str) -> str:
+    """Read a small text file, returning an empty string if it is missing"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def bench_posters(count: int) -> dict:
+    """Render count posters stage by stage and return the JSON report"""
+    templates = app.list_templates()
+    if not templates:
+        raise SystemExit("No templates found in Templates/")
+
+    timings = {stage: [] for stage in STAGES}
+    # Largest resident memory growth seen across one run of each stage (ru_maxrss only ever rises)
+    rss_growth = {stage: 0.0 for stage in STAGES}
+    output_bytes = []
+    formats = {}
+
+    def measure(stage, func, *args):
+        rss_before = current_rss_mb()
+        result, ms = timed(func, *args)
+        timings[stage].append(ms)
+        rss_growth[stage] = max(rss_growth[stage], current_rss_mb() - rss_before)
+        return result
+
+    with quiet():
+        # One-off cold costs: first template cache fill and first font load
+        first_template, template_cold_ms = timed(app.load_template_image, templates[0])
+        app.load_truetype_cached.cache_clear()
+        _, font_cold_ms = timed(app.load_poster_fonts, first_template.size[1])
+        for template_path in templates[1:]:
+            app.load_template_image(template_path)
+
+        for i in range(count):
+            template_path = templates[i % len(templates)]
+            team1 = CAPTAIN_NAMES[i % len(CAPTAIN_NAMES)]
+            team2 = CAPTAIN_NAMES[(i * 5 + 3) % len(CAPTAIN_NAMES)]
+            round_label = ROUNDS[i % len(ROUNDS)]
+            utc_time = f"{12 + i % 6:02d}:{(i % 2) * 30:02d} UTC"
+            date_str = f"{1 + i % 28:02d}/{1 + i % 12:02d}/2026"
+
+            def decode():
+                with Image.open(template_path) as img:
+                    return img.convert("RGBA")
+
+            decoded = measure('decode', decode)
+            measure('resize', decoded.resize, app.get_poster_size(decoded.size), Image.Resampling.LANCZOS)
+            template = measure('template_cache', app.load_template_image, template_path)
+            measure('font_load', app.load_poster_fonts, template.size[1])
+            measure('sanitize', lambda: (app.sanitize_username_for_poster(team1), app.sanitize_username_for_poster(team2)))
+
+            poster = template.copy()
+            measure('text', app.draw_poster_overlays, poster, round_label, team1, team2, utc_time, date_str)
+
+            data, info = measure('encode', app.encode_poster, poster)
+            output_bytes.append(len(data))
+            formats[info['format']] = formats.get(info['format'], 0) + 1
+
+            # Full render path, bypassing the poster cache
+            measure('end_to_end', app._render_event_poster, template_path, round_label, team1, team2, utc_time, date_str)
+
+    return {
+        'benchmark': 'posters',
+        'bot_version': read_text_file("VERSION"),
+        'python': platform.python_version(),
+        'pillow': PIL.__version__,
+        'platform': platform.platform(),
+        'posters': count,
+        'templates': len(templates),
+        'encoder': {
+            'formats': app.POSTER_FORMATS,
+            'byte_budget_kb': app.POSTER_BYTE_BUDGET_KB,
+            'quality': app.POSTER_QUALITY,
+        },
+        'stages_ms': {
+            stage: dict(summarize(values), rss_growth_mb=round(rss_growth[stage], 2))
+            for stage, values in timings.items()
+        },
+        'cold_ms': {
+            'font_load': round(font_cold_ms, 3),
+            'template_cache': round(template_cold_ms, 3),
+        },
+        'output_bytes': summarize(output_bytes),
+        'output_formats': formats,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+def legacy_draw_text_with_outline(draw, text, x, y, font, fill, outline_color, outline_width=4):
+    """Reference implementation: stamp the text at every offset of the outline grid"""
+    for dx in range(-outline_width, outline_width + 1):
+        for dy in range(-outline_width, outline_width + 1):
+            if dx != 0 or dy != 0:
+                draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
+    draw.text((x, y), text, font=font, fill=fill)
+
+def bench_outline(iterations: int):
+    """Time the legacy 80-stamp outline against the cached text layer compositor"""
+    with quiet():
+        template = app.load_template_image(app.list_templates()[0])
+        font_title, font_round, font_vs, font_time, _ = app.load_poster_fonts(template.size[1])
+    fonts = {"title": font_title, "round": font_round, "vs": font_vs, "time": font_time}
+    white, black = (255, 255, 255), (0, 0, 0)
+
+    def run_legacy():
+        poster = template.copy()
+        draw = ImageDraw.Draw(poster)
+        for i, (text, font_key) in enumerate(OUTLINE_SAMPLES):
+            legacy_draw_text_with_outline(draw, text, 20, 20 + i * 60, fonts[font_key], white, black)
+        return poster
+
+    def run_compositor():
+        poster = template.copy()
+        for i, (text, font_key) in enumerate(OUTLINE_SAMPLES):
+            app.draw_outlined_text(poster, (20, 20 + i * 60), text, fonts[font_key], white, black)
+        return poster
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        legacy = run_legacy()
+    legacy_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    app._text_layer_cache.clear()
+    start = time.perf_counter()
+    composited = run_compositor()
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        composited = run_compositor()
+    warm_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    # Largest per-channel difference between the two outputs
+    extrema = ImageChops.difference(legacy.convert("RGB"), composited.convert("RGB")).getextrema()
+    diff = max(high for _, high in extrema)
+
+    print(f"Outline text ({len(OUTLINE_SAMPLES)} strings per poster, {iterations} iteration(s))")
+    print(f"  legacy 80-stamp loop : {legacy_ms:8.2f} ms/poster")
+    print(f"  compositor (cold)    : {cold_ms:8.2f} ms/poster")
+    print(f"  compositor (cached)  : {warm_ms:8.2f} ms/poster")
+    print(f"  max channel diff     : {diff}")
+
+def run_suite(args):
+    if args.suite == "posters":
+        report = bench_posters(args.posters)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Wrote {args.output}")
+        else:
+            print(json.dumps(report, indent=2))
+    elif args.suite == "outline":
+        bench_outline(args.iterations)
+
+def main():
+    parser = argparse.ArgumentParser(description="ICF Tournament Bot poster benchmarks")
+    parser.add_argument("suite", choices=["posters", "outline"], help="Benchmark to run")
+    parser.add_argument("--posters", type=int, default=20, help="Posters to render (posters suite)")
+    parser.add_argument("--iterations", type=int, default=5, help="Iterations per measurement (outline suite)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        run_suite(args)
+    finally:
+        _bench_cache_dir.cleanup()
+
+if __name__ == "__main__":
+    main()